@@ -5,7 +5,7 @@ from fastapi.encoders import jsonable_encoder
 from aws_lambda_powertools import Logger
 from pydantic import BaseModel, Field, validator
 from typing import Optional, Literal
-from datetime import datetime
+import time
 
 from api.decorators.exceptions_decorator import exceptions_decorator
 from common.helpers.bet_helper import BetHelper
@@ -196,7 +196,7 @@ def create_bet(request: Request, bet_request: CreateBetRequest):
         game_bet=game_bet,
         points_wagered=bet_request.game_bet.points_wagered,
         locked=False,  # New bets start unlocked
-        submitted_at=int(datetime.utcnow().timestamp()),
+        submitted_at=int(time.time()),
         odds_snapshot=bet_request.odds_snapshot,
     )
 
@@ -4,7 +4,7 @@ from fastapi.encoders import jsonable_encoder
 from aws_lambda_powertools import Logger
 from pydantic import BaseModel
 from typing import Optional
-from datetime import datetime
+import time
 from decimal import Decimal
 
 from api.decorators.exceptions_decorator import exceptions_decorator
@@ -76,7 +76,7 @@ def change_member_status(request: Request, change_request: ChangeMemberStatusMod
         membership_helper = MembershipHelper(request_id=request.state.request_id)
 
         # Check if the user is admin of this room
-        room = room_helper.get_room(change_request.room_id)
+        room = room_helper.get_room(change_request.room_id, use_cache=False)
         if not room:
             raise HTTPException(status_code=404, detail="Room not found")
 
@@ -120,15 +120,23 @@ def change_member_status(request: Request, change_request: ChangeMemberStatusMod
             new_membership_type = MembershipType.MEMBER
 
         # Update the membership
-        current_time = int(datetime.utcnow().timestamp())
+        current_time = int(time.time())
 
         update_expression = (
-            "SET #status = :status, updated_at = :updated_at, admin_id = :admin_id"
+            "SET #status = :status, updated_at = :updated_at, admin_id = :admin_id, "
+            "user_id = :user_id, status_type = :status_type"
+        )
+        membership_type_value = (
+            new_membership_type.value
+            if new_membership_type
+            else existing_membership.get("membership_type")
         )
         expression_attribute_values = {
             ":status": new_status.value,
             ":updated_at": current_time,
             ":admin_id": admin_user_id,
+            ":user_id": change_request.target_user_id,
+            ":status_type": f"{new_status.value}#{membership_type_value}",
         }
         expression_attribute_names = {"#status": "status"}
 
@@ -65,15 +65,14 @@ def create_membership_request(
     user_profile = user_profile_helper.get_user_profile(user_id=user_id)
 
     try:
-        for admin in room_admins:
-            notification_helper = NotificationHelper(
-                request_id=request.state.request_id
-            )
-            notification_helper.create_notification(
-                user_id=admin,
-                message=f"User {user_profile['name']} has requested to join your room: {room['room_name']}",
-                notification_type=NotificationType.MEMBERSHIP_REQUEST,
-            )
+        notification_helper = NotificationHelper(request_id=request.state.request_id)
+        message = f"User {user_profile['name']} has requested to join your room: {room['room_name']}"
+        notification_helper.create_notifications(
+            [
+                (admin, message, NotificationType.MEMBERSHIP_REQUEST)
+                for admin in room_admins
+            ]
+        )
     except Exception as e:
         logger.error(f"Error creating notification for room admins: {e}")
 
@@ -77,15 +77,14 @@ def edit_membership_request(request: Request, edit_request: EditMembershipReques
         logger.info(f"Room details: {room}")
         room_admins = room.get("admins", [])
 
-        for admin in room_admins:
-            notification_helper = NotificationHelper(
-                request_id=request.state.request_id
-            )
-            notification_helper.create_notification(
-                user_id=admin,
-                message=f"Admin {membership_approval_user} has {action} the membership request for user {membership_request_user} in room: {room['room_name']}",
-                notification_type=NotificationType.MEMBERSHIP_REQUEST,
-            )
+        notification_helper = NotificationHelper(request_id=request.state.request_id)
+        message = f"Admin {membership_approval_user} has {action} the membership request for user {membership_request_user} in room: {room['room_name']}"
+        notification_helper.create_notifications(
+            [
+                (admin, message, NotificationType.MEMBERSHIP_REQUEST)
+                for admin in room_admins
+            ]
+        )
     except Exception as e:
         logger.error(f"Error creating notification for room admins: {e}")
 
@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
 from aws_lambda_powertools import Logger
 from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 from api.decorators.exceptions_decorator import exceptions_decorator
@@ -16,6 +17,30 @@ from common.constants.services import API_SERVICE
 logger = Logger(service=API_SERVICE)
 router = APIRouter()
 
+# Membership attributes this endpoint actually returns
+MEMBER_ATTRIBUTES = [
+    "SK",
+    "status",
+    "membership_type",
+    "join_date",
+    "created_at",
+    "admin_id",
+]
+
+
+# Every (status, membership_type) pair the endpoint returns, in listing order
+_STATUS_TYPE_PAIRS = tuple(
+    (status.value, membership_type.value)
+    for status in MembershipStatus
+    for membership_type in MembershipType
+)
+
+# Shared across requests so the membership query can overlap the room lookup
+# without starting a new thread pool on every call
+_MEMBERSHIP_READ_POOL = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="room-members"
+)
+
 
 def convert_decimal(obj):
     """Convert Decimal objects to int or float for JSON serialization"""
@@ -58,24 +83,36 @@ def get_room_members(request: Request, room_id: str):
         membership_helper = MembershipHelper(request_id=request.state.request_id)
         user_profile_helper = UserProfileHelper(request_id=request.state.request_id)
 
+        # One query reads every membership of the room; it runs on the shared
+        # pool while the room is looked up on this thread
+        memberships_future = _MEMBERSHIP_READ_POOL.submit(
+            membership_helper.get_room_memberships,
+            room_id,
+            projection=MEMBER_ATTRIBUTES,
+        )
+
         # Check if the user is admin of this room
-        room = room_helper.get_room(room_id)
+        room = room_helper.get_room(room_id, use_cache=False)
+        memberships = memberships_future.result()
         if not room:
             raise HTTPException(status_code=404, detail="Room not found")
 
-        # Check both possible field names for backward compatibility
-        admin_ids = room.get("admin_user_ids", []) or room.get("admins", [])
+        # Group the memberships by status and type, keeping only known pairs
+        memberships_by_pair = {}
+        for membership in memberships:
+            pair = (membership.get("status"), membership.get("membership_type"))
+            if pair in _STATUS_TYPE_PAIRS:
+                memberships_by_pair.setdefault(pair, []).append(membership)
 
         # Get all membership records for the room (all statuses and types)
-        all_memberships = []
-
-        # Get all membership statuses
-        for status in MembershipStatus:
-            for membership_type in MembershipType:
-                memberships = membership_helper.get_room_memberships_by_status_and_type(
-                    room_id, status, membership_type
-                )
-                all_memberships.extend(memberships)
+        all_memberships = [
+            membership
+            for pair in _STATUS_TYPE_PAIRS
+            for membership in memberships_by_pair.get(pair, [])
+        ]
+
+        # Check both possible field names for backward compatibility
+        admin_ids = room.get("admin_user_ids", []) or room.get("admins", [])
 
         # Process and organize the data
         processed_members = []
@@ -11,6 +11,7 @@ from common.constants.metrics import (
     ENDPOINT,
 )
 from datetime import datetime
+import time
 
 router = APIRouter()
 logger = Logger(service=API_SERVICE)
@@ -46,7 +47,7 @@ async def get_nfl_weeks_in_range(
             )
 
         # Validate that dates are reasonable (not too far in past/future)
-        current_timestamp = datetime.now().timestamp()
+        current_timestamp = int(time.time())
         max_range = 365 * 24 * 60 * 60 * 5  # 5 years in seconds
 
         if (
@@ -64,7 +65,9 @@ async def get_nfl_weeks_in_range(
         nfl_helper = NFLHelper(request_id=request.state.request_id)
 
         # Find weeks in range
-        weeks_in_range = nfl_helper.find_nfl_weeks_in_range(start_date, end_date)
+        weeks_in_range = nfl_helper.find_nfl_weeks_in_range(
+            start_date, end_date, include_iso=True
+        )
 
         # Group by season for easier consumption
         seasons_summary = nfl_helper.group_weeks_by_season(weeks_in_range)
@@ -3,11 +3,15 @@ from mangum import Mangum
 from aws_lambda_powertools import Logger
 from middleware.request_id_middlware import RequestIdMiddleware
 from middleware.memory_cleanup_middleware import MemoryCleanupMiddleware
+from middleware.background_writes_middleware import BackgroundWritesMiddleware
 from api.endpoints.get_all_routes import get_all_routes
 from fastapi.middleware.cors import CORSMiddleware
 from middleware.jtw_middleware import JWTMiddleware
 from common.helpers.jwt import inject_user_token
-from middleware.cognito_auth_middleware import CognitoAuthMiddleware
+from middleware.cognito_auth_middleware import (
+    CognitoAuthMiddleware,
+    close_cognito_client,
+)
 import os
 import configparser
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -35,6 +39,7 @@ app.add_middleware(CognitoAuthMiddleware)
 app.add_middleware(RequestIdMiddleware)
 app.add_middleware(JWTMiddleware)
 app.add_middleware(MemoryCleanupMiddleware)
+app.add_middleware(BackgroundWritesMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -45,6 +50,12 @@ app.add_middleware(
 
 inject_user_token()
 
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_cognito_client()
+
+
 app = get_all_routes(app)
 
 handler = Mangum(app)
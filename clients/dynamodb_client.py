@@ -0,0 +1,82 @@
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
+import boto3
+import os
+import threading
+from typing import Dict, Optional
+
+# Shared DynamoDB resource for the whole Lambda container. Helpers are built per
+# request, so creating the resource here keeps its connection pool (and the TLS
+# sessions in it) alive across warm invocations. The resource and its Tables
+# are not thread-safe; code running on worker threads uses get_dynamodb_client().
+DYNAMODB_REGION = "us-west-2"
+
+# Only the audit and membership helpers fall back to this table when TABLE_NAME
+# is unset; every other helper requires TABLE_NAME.
+DEFAULT_TABLE_NAME = "FortunasBet-UserTable-Testing"
+
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 8},
+)
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+_session = None
+_resource = None
+_tables: Dict[str, object] = {}
+_lock = threading.Lock()
+
+
+def get_dynamodb_resource():
+    """
+    Return the container-wide DynamoDB resource, creating it on first use.
+    """
+    global _session, _resource
+    if _resource is None:
+        with _lock:
+            if _resource is None:
+                # A dedicated session resolves credentials once and, unlike the
+                # boto3 default session, is never rebuilt by other callers.
+                _session = boto3.session.Session(region_name=DYNAMODB_REGION)
+                _resource = _session.resource("dynamodb", config=DYNAMODB_CONFIG)
+    return _resource
+
+
+def get_table(table_name: Optional[str] = None):
+    """
+    Return the cached Table for table_name, defaulting to the TABLE_NAME env var.
+    Raises KeyError if neither is set.
+    """
+    if not table_name:
+        table_name = os.environ["TABLE_NAME"]
+    table = _tables.get(table_name)
+    if table is None:
+        table = get_dynamodb_resource().Table(table_name)
+        _tables[table_name] = table
+    return table
+
+
+def get_dynamodb_client():
+    """
+    Return the low-level client behind the shared resource, for calls such as
+    transact_write_items that the resource does not expose. Unlike the
+    resource, the client is thread-safe.
+    """
+    return get_dynamodb_resource().meta.client
+
+
+def serialize_item(item: dict) -> dict:
+    """
+    Convert a plain Python dict into DynamoDB attribute-value format.
+    """
+    return {key: _serializer.serialize(value) for key, value in item.items()}
+
+
+def deserialize_item(item: dict) -> dict:
+    """
+    Convert a DynamoDB attribute-value item, such as one returned on a failed
+    condition check, back into a plain Python dict.
+    """
+    return {key: _deserializer.deserialize(value) for key, value in item.items()}
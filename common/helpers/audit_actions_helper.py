@@ -2,11 +2,40 @@ from enum import Enum
 from datetime import datetime
 from typing import Any
 from aws_lambda_powertools import Logger
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import threading
 from botocore.exceptions import ClientError
-import boto3
+from clients.dynamodb_client import (
+    DEFAULT_TABLE_NAME,
+    get_dynamodb_client,
+    get_dynamodb_resource,
+    get_table,
+    serialize_item,
+)
 import os
 from decimal import Decimal
 
+# Audit writes that nothing waits on are handed to this container-wide pool so
+# they stay off the request's critical path.
+_AUDIT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="audit-writer")
+_PENDING_AUDITS = set()
+_PENDING_AUDITS_LOCK = threading.Lock()
+
+
+def _audit_done(future: Future) -> None:
+    with _PENDING_AUDITS_LOCK:
+        _PENDING_AUDITS.discard(future)
+
+
+def drain_audit_records() -> None:
+    """
+    Block until every submitted audit write has finished. Called before each
+    API response so no audit record is lost when Lambda freezes the container.
+    """
+    with _PENDING_AUDITS_LOCK:
+        pending = list(_PENDING_AUDITS)
+    wait(pending)
+
 
 class AuditActions(Enum):
     CREATE = "create"
@@ -25,12 +54,10 @@ class AuditActionHelper:
         Initializes the helper with a DynamoDB table.
         :param table: The DynamoDB table instance.
         """
-        self.dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
-        if table_name:
-            self.table = self.dynamodb.Table(table_name)
-        else:
-            table_name = os.getenv("TABLE_NAME", "FortunasBet-UserTable-Testing")
-            self.table = self.dynamodb.Table(table_name)
+        self.dynamodb = get_dynamodb_resource()
+        self.table = get_table(
+            table_name or os.getenv("TABLE_NAME", DEFAULT_TABLE_NAME)
+        )
         self.logger = Logger()
         self.logger.append_keys(request_id=request_id)
 
@@ -53,7 +80,7 @@ class AuditActionHelper:
         else:
             return obj
 
-    def create_audit_record(
+    def build_audit_record(
         self,
         pk: str,
         sk: str,
@@ -64,8 +91,8 @@ class AuditActionHelper:
         after: Any,
     ) -> dict:
         """
-        Create a new audit record for each action.
-        Each audit action gets its own DynamoDB item for better performance and compliance.
+        Build the audit item for an action without writing it, so callers can
+        include it in their own transaction.
 
         Args:
             pk: The partition key for the audit record
@@ -77,34 +104,90 @@ class AuditActionHelper:
             after: State after the change (None for DELETE)
         """
         timestamp = datetime.utcnow()
-        timestamp_iso = timestamp.isoformat()
-        timestamp_unix = int(timestamp.timestamp())
 
-        before_dict = self.convert_floats_to_decimal(self.to_dict(before))
-        after_dict = self.convert_floats_to_decimal(self.to_dict(after))
-
-        audit_item = {
+        return {
             "PK": pk,
             "SK": sk,
             "user_id": user_id,
             "entity_type": entity_type,
             "action": action,
-            "before": before_dict,
-            "after": after_dict,
-            "timestamp": timestamp_iso,
-            "timestamp_unix": timestamp_unix,
+            "before": self.convert_floats_to_decimal(self.to_dict(before)),
+            "after": self.convert_floats_to_decimal(self.to_dict(after)),
+            "timestamp": timestamp.isoformat(),
+            "timestamp_unix": int(timestamp.timestamp()),
+        }
+
+    def build_audit_put(self, **audit_kwargs) -> dict:
+        """
+        Build the TransactWriteItems Put for an audit record, taking the same
+        arguments as build_audit_record.
+        """
+        return {
+            "Put": {
+                "TableName": self.table.name,
+                "Item": serialize_item(self.build_audit_record(**audit_kwargs)),
+            }
         }
 
+    def create_audit_record(
+        self,
+        pk: str,
+        sk: str,
+        user_id: str,
+        entity_type: str,
+        action: str,
+        before: Any,
+        after: Any,
+    ) -> dict:
+        """
+        Create a new audit record for each action.
+        Each audit action gets its own DynamoDB item for better performance and compliance.
+
+        Args:
+            pk: The partition key for the audit record
+            sk: The sort key for the audit record
+            user_id: The user performing the action
+            entity_type: Type of entity being audited (e.g., "PROFILE", "STRAVA", "BET")
+            action: The action performed (CREATE, UPDATE, DELETE)
+            before: State before the change (None for CREATE)
+            after: State after the change (None for DELETE)
+        """
+        audit_item = self.build_audit_record(
+            pk=pk,
+            sk=sk,
+            user_id=user_id,
+            entity_type=entity_type,
+            action=action,
+            before=before,
+            after=after,
+        )
+
         try:
-            self.table.put_item(Item=audit_item)
+            # Also runs on the audit pool's threads, so it goes through the
+            # thread-safe client rather than the shared Table
+            get_dynamodb_client().put_item(
+                TableName=self.table.name, Item=serialize_item(audit_item)
+            )
             self.logger.info(
-                f"Created audit record for {user_id}: {entity_type} {action} at {timestamp_iso}"
+                f"Created audit record for {user_id}: {entity_type} {action} at {audit_item['timestamp']}"
             )
             return audit_item
         except ClientError as e:
             self.logger.error(f"Error creating audit record for {user_id}: {e}")
             raise
 
+    def submit_audit_record(self, **audit_kwargs) -> Future:
+        """
+        Write an audit record in the background and return its future.
+        Takes the same arguments as create_audit_record; failures are logged
+        there and re-raised from future.result() for callers that wait.
+        """
+        future = _AUDIT_POOL.submit(self.create_audit_record, **audit_kwargs)
+        with _PENDING_AUDITS_LOCK:
+            _PENDING_AUDITS.add(future)
+        future.add_done_callback(_audit_done)
+        return future
+
     def get_audit_trail(self, pk: str, sk_prefix: str, limit: int = 50):
         """
         Get audit trail for any entity, filtered by partition key and sort key prefix.
@@ -1,6 +1,14 @@
 from aws_lambda_powertools import Logger
-import boto3
 from botocore.exceptions import ClientError
+from clients.dynamodb_client import (
+    deserialize_item,
+    get_dynamodb_client,
+    get_dynamodb_resource,
+    get_table,
+    serialize_item,
+)
+from common.constants.services import API_SERVICE
+from concurrent.futures import ThreadPoolExecutor
 from common.models.bet import BetModel
 from datetime import datetime
 from exceptions.bet_exceptions import (
@@ -9,13 +17,129 @@ from exceptions.bet_exceptions import (
     InvalidGameStatusException,
     DuplicateGameException,
 )
-import os
+import queue
+import threading
+import time
 from typing import List, Optional, Any, Dict
 from decimal import Decimal
 from clients.espn_client import ESPNClient
 import random
 import uuid
 
+logger = Logger(service=API_SERVICE)
+
+# GSI keyed by room and user so a user's bets can be read without touching
+# the rest of the room partition.
+BET_USER_INDEX = "GSI_User"
+
+# Attributes consumed by bet readers, grading and the status write-back. The
+# cached ESPN payloads (current_status, game_status) are left out since they
+# are refreshed from ESPN on every read anyway.
+_BET_ATTRIBUTES = (
+    "PK",
+    "SK",
+    "GSI_PK",
+    "GSI_SK",
+    "room_id",
+    "bet_id",
+    "bet_uuid",
+    "season_type",
+    "week",
+    "event_datetime",
+    "game_id",
+    "sport",
+    "league",
+    "user_id",
+    "game_bet",
+    "points_wagered",
+    "total_points_earned",
+    "graded_at",
+    "submitted_at",
+    "odds_snapshot",
+)
+_BET_PROJECTION = {
+    "ProjectionExpression": ", ".join(f"#{name}" for name in _BET_ATTRIBUTES),
+    "ExpressionAttributeNames": {f"#{name}": name for name in _BET_ATTRIBUTES},
+}
+
+# Game status refreshes picked up while reading bets are persisted by a
+# background worker so the read path never waits on a DynamoDB write.
+_STATUS_WRITE_QUEUE: "queue.Queue" = queue.Queue()
+
+# ESPN events for finished games never change again, so they are kept for the
+# lifetime of the container, keyed by (sport, league, game_id).
+_COMPLETED_GAMES: Dict[tuple, tuple] = {}
+
+# Upper bound on concurrent ESPN requests when reading a list of bets
+_GAME_FETCH_WORKERS = 8
+
+# BatchGetItem accepts at most 100 keys per request
+_BATCH_GET_SIZE = 100
+_BATCH_GET_MAX_RETRIES = 5
+
+
+def _write_status(table_name: str, key: dict, field: str, value: Any) -> None:
+    """
+    Persist one refreshed status field on a bet. Only that field is set, and
+    never on a bet that has been graded since it was read, so a late write
+    cannot undo a grading done by another invocation.
+    """
+    try:
+        get_dynamodb_client().update_item(
+            TableName=table_name,
+            Key=serialize_item(key),
+            UpdateExpression="SET #f = :v",
+            ConditionExpression="attribute_exists(PK) AND attribute_not_exists(graded_at)",
+            ExpressionAttributeNames={"#f": field},
+            ExpressionAttributeValues=serialize_item({":v": value}),
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            logger.info(
+                "Skipped %s update for graded or deleted bet PK: %s, SK: %s",
+                field,
+                key["PK"],
+                key["SK"],
+            )
+        else:
+            logger.error(
+                "Error persisting %s for PK: %s, SK: %s: %s",
+                field,
+                key["PK"],
+                key["SK"],
+                e,
+            )
+    except Exception as e:
+        logger.error(
+            "Error persisting %s for PK: %s, SK: %s: %s", field, key["PK"], key["SK"], e
+        )
+
+
+def _status_write_worker() -> None:
+    """
+    Persist queued status writes one at a time.
+    """
+    while True:
+        write = _STATUS_WRITE_QUEUE.get()
+        try:
+            _write_status(*write)
+        finally:
+            _STATUS_WRITE_QUEUE.task_done()
+
+
+def drain_status_writes() -> None:
+    """
+    Block until every queued status write has been persisted. Called before
+    each API response so nothing is left queued when Lambda freezes the
+    container.
+    """
+    _STATUS_WRITE_QUEUE.join()
+
+
+threading.Thread(
+    target=_status_write_worker, name="bet-status-writer", daemon=True
+).start()
+
 
 class BetHelper:
     """
@@ -23,18 +147,107 @@ class BetHelper:
     """
 
     def __init__(self, request_id: str, table_name: str = None):
-        self.dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
-
-        if table_name:
-            self.table = self.dynamodb.Table(table_name)
-        else:
-            table_name = os.getenv("TABLE_NAME")
-            self.table = self.dynamodb.Table(table_name)
+        self.dynamodb = get_dynamodb_resource()
+        self.table = get_table(table_name)
 
         self.logger = Logger()
         self.request_id = request_id
         self.logger.append_keys(request_id=request_id)
 
+        self._espn = None
+        self._week = None
+        self._games: Dict[tuple, Optional[tuple]] = {}
+
+    def _espn_client(self) -> ESPNClient:
+        """
+        Lazily create the ESPN client shared by every call on this helper.
+        """
+        if self._espn is None:
+            self._espn = ESPNClient(request_id=self.request_id)
+        return self._espn
+
+    def _get_game(
+        self,
+        sport: str,
+        league: str,
+        game_id: str,
+        espn_client: Optional[ESPNClient] = None,
+    ) -> Optional[tuple]:
+        """
+        Fetch an ESPN event once per helper and parse its competitors alongside it.
+
+        Args:
+            espn_client: Client to fetch with; defaults to the helper's shared client
+
+        Returns:
+            (game_data, competitors) or None if ESPN returned no data
+        """
+        key = (sport, league, game_id)
+        if key in _COMPLETED_GAMES:
+            return _COMPLETED_GAMES[key]
+
+        if key not in self._games:
+            espn_client = espn_client or self._espn_client()
+            game_data = espn_client.get_event(
+                sport=sport, league=league, event_id=game_id
+            )
+            game = None
+            if game_data:
+                game = (game_data, self._parse_competitors(game_data))
+                if game_data.get("status", {}).get("completed") is True:
+                    _COMPLETED_GAMES[key] = game
+            self._games[key] = game
+        return self._games[key]
+
+    def _parse_competitors(self, game_data: dict) -> Optional[tuple]:
+        """
+        Parse ESPN competitors into home and away team summaries.
+
+        Returns:
+            (home_team, away_team, total_score), or None if a score is not numeric.
+            total_score is None when the event has no competitors.
+        """
+        competitors = game_data.get("competitors", [])
+        if not competitors:
+            return None, None, None
+
+        home_team = None
+        away_team = None
+        total_score = 0
+        try:
+            for competitor in competitors:
+                name = competitor.get("name", "Unknown")
+                score = int(competitor.get("score", 0))
+                total_score += score
+                team_info = {
+                    "name": name,
+                    "short_name": competitor.get(
+                        "abbreviation", competitor.get("name", "UNK")[:3].upper()
+                    ),
+                    "score": score,
+                }
+
+                side = competitor.get("homeAway", "").lower()
+                if side == "home":
+                    home_team = team_info
+                elif side == "away":
+                    away_team = team_info
+        except (ValueError, TypeError) as e:
+            self.logger.error(f"Error parsing competitor scores {competitors}: {e}")
+            return None
+
+        return home_team, away_team, total_score
+
+    def _week_helper(self):
+        """
+        Lazily create the WeekHelper shared by every call on this helper.
+        """
+        if self._week is None:
+            from common.helpers.week_helper import WeekHelper
+
+            self._week = WeekHelper(request_id=self.request_id)
+        return self._week
+
     def _convert_floats_to_decimals(self, obj: Any) -> Any:
         """
         Recursively convert float values to Decimal values for DynamoDB compatibility.
@@ -67,22 +280,52 @@ class BetHelper:
         else:
             return obj
 
+    def _query_all(self, **query_kwargs) -> List[dict]:
+        """
+        Run a query and follow LastEvaluatedKey until every page has been read.
+        """
+        items = []
+        while True:
+            response = self.table.query(**query_kwargs)
+            items.extend(response.get("Items", []))
+
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                return items
+            query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+    def _bet_key(
+        self, room_id: str, points_wagered: int, user_id: str, event_datetime: int
+    ) -> dict:
+        """
+        Build the table key of a bet.
+        """
+        return {
+            "PK": f"ROOM#{room_id}",
+            "SK": f"POINT#{points_wagered}#USER#{user_id}#EVENT#{event_datetime}",
+        }
+
+    def _user_index_keys(
+        self, room_pk: str, user_id: str, points_wagered: int, event_datetime: int
+    ) -> dict:
+        """
+        Build the GSI_User key attributes for a bet from its room PK.
+        """
+        return {
+            "GSI_PK": f"{room_pk}#USER#{user_id}",
+            "GSI_SK": f"POINT#{points_wagered}#EVENT#{event_datetime}",
+        }
+
     def create_bet(self, bet: BetModel) -> dict:
         """
         Create a new bet in DynamoDB.
         PK: ROOM#{room_id}
         SK: POINT#{points_wagered}#USER#{user_id}#EVENT#{event_datetime}
 
-        Validates that the bet doesn't already exist and checks week boundary constraints.
+        Validates week boundary constraints; the put itself is conditional so an
+        identical existing bet is rejected without a separate lookup.
         """
-        # First check if exact bet already exists (same event)
-        existing_bet = self.get_bet(
-            bet.room_id, bet.points_wagered, bet.user_id, bet.event_datetime
-        )
-        if existing_bet:
-            raise DuplicateBetException(bet.room_id, bet.user_id, bet.points_wagered)
-
-        # Then validate week boundary constraints
+        # Validate week boundary constraints
         self.validate_week_boundary_bet(
             room_id=bet.room_id,
             user_id=bet.user_id,
@@ -94,27 +337,43 @@ class BetHelper:
         )
 
         item = bet.dict()
-        item["PK"] = f"ROOM#{bet.room_id}"
-        item["SK"] = (
-            f"POINT#{bet.points_wagered}#USER#{bet.user_id}#EVENT#{bet.event_datetime}"
+        item.update(
+            self._bet_key(
+                bet.room_id, bet.points_wagered, bet.user_id, bet.event_datetime
+            )
+        )
+        item.update(
+            self._user_index_keys(
+                item["PK"], bet.user_id, bet.points_wagered, bet.event_datetime
+            )
         )
 
         # Convert float values to Decimal for DynamoDB compatibility
         item = self._convert_floats_to_decimals(item)
 
         # Check if the user has already placed a bet on the same game ID
-        user_game_ids = self.get_user_game_ids_for_room(bet.room_id, bet.user_id)
+        user_game_ids = self._query_user_game_ids(item["GSI_PK"])
         if bet.game_id in user_game_ids:
             raise DuplicateGameException(bet.game_id)
 
         try:
-            self.table.put_item(Item=item)
+            self.table.put_item(
+                Item=item,
+                ConditionExpression="attribute_not_exists(PK) AND attribute_not_exists(SK)",
+            )
             self.logger.info(
                 f"Created {bet.points_wagered}-point bet for user {bet.user_id} in room {bet.room_id}: {item}"
             )
 
             return item
         except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                self.logger.warning(
+                    f"{bet.points_wagered}-point bet for user {bet.user_id} in room {bet.room_id} for event {bet.event_datetime} already exists"
+                )
+                raise DuplicateBetException(
+                    bet.room_id, bet.user_id, bet.points_wagered
+                )
             self.logger.error(
                 f"Error creating bet for user {bet.user_id} in room {bet.room_id}: {e}"
             )
@@ -131,10 +390,8 @@ class BetHelper:
         Fetch a specific bet from DynamoDB using the exact SK.
         """
         response = self.table.get_item(
-            Key={
-                "PK": f"ROOM#{room_id}",
-                "SK": f"POINT#{points_wagered}#USER#{user_id}#EVENT#{event_datetime}",
-            }
+            Key=self._bet_key(room_id, points_wagered, user_id, event_datetime),
+            **_BET_PROJECTION,
         )
 
         item = response.get("Item")
@@ -142,13 +399,8 @@ class BetHelper:
             # Convert Decimal values back to float for JSON serialization
             serializable_item = self._convert_decimals_to_floats(item)
 
-            # Check and grade the bet if needed
-            graded_bet = self.check_and_grade_bet(serializable_item)
-            if graded_bet:
-                serializable_item = graded_bet
-
-            # Enhance with current ESPN game data
-            enhanced_item = self._enhance_bet_with_game_data(serializable_item)
+            # Check and grade the bet if needed, then enhance with current ESPN game data
+            enhanced_item = self._grade_and_enhance_bets([serializable_item])[0]
 
             self.logger.info(
                 f"Retrieved {points_wagered}-point bet for user {user_id} in room {room_id} for event {event_datetime}"
@@ -160,19 +412,117 @@ class BetHelper:
         )
         return None
 
+    def _grade_and_enhance_bets(self, items: List[dict]) -> List[dict]:
+        """
+        Grade bets that still need it and attach current game data to every bet.
+
+        Already graded bets skip check_and_grade_bet entirely. The ESPN events the
+        bets need are fetched up front, concurrently and once per unique game.
+        """
+        self._prefetch_games(items)
+
+        graded_items = []
+        for item in items:
+            if item.get("total_points_earned") is None or not item.get("graded_at"):
+                graded_bet = self.check_and_grade_bet(item)
+                if graded_bet:
+                    item = graded_bet
+            graded_items.append(self._enhance_bet_with_game_data(item))
+        return graded_items
+
+    def _prefetch_games(self, items: List[dict]) -> None:
+        """
+        Fetch the ESPN events for a list of bets in parallel, one request per game.
+        """
+        pending = {
+            (item.get("sport"), item.get("league"), item.get("game_id"))
+            for item in items
+        }
+        pending = [
+            key
+            for key in pending
+            if all(key) and key not in _COMPLETED_GAMES and key not in self._games
+        ]
+        if len(pending) < 2:
+            return
+
+        def fetch(key: tuple) -> None:
+            # ESPNClient records metrics on the instance, so each worker gets its own
+            self._get_game(*key, espn_client=ESPNClient(request_id=self.request_id))
+
+        with ThreadPoolExecutor(
+            max_workers=min(_GAME_FETCH_WORKERS, len(pending))
+        ) as pool:
+            list(pool.map(fetch, pending))
+
+        self.logger.info(f"Prefetched ESPN data for {len(pending)} games")
+
+    def get_bets_bulk(self, keys: List[tuple]) -> List[dict]:
+        """
+        Fetch several bets at once with BatchGetItem.
+
+        Args:
+            keys: (room_id, points_wagered, user_id, event_datetime) tuples.
+
+        Returns:
+            The bets that exist, in the order their keys were given.
+        """
+        table_name = self.table.name
+        requested = [self._bet_key(*key) for key in keys]
+        unique_keys = list({(key["PK"], key["SK"]): key for key in requested}.values())
+
+        items_by_key = {}
+        try:
+            for start in range(0, len(unique_keys), _BATCH_GET_SIZE):
+                request_items = {
+                    table_name: {
+                        "Keys": unique_keys[start : start + _BATCH_GET_SIZE],
+                        **_BET_PROJECTION,
+                    }
+                }
+                attempt = 0
+                while request_items:
+                    response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                    for item in response.get("Responses", {}).get(table_name, []):
+                        items_by_key[(item["PK"], item["SK"])] = item
+
+                    request_items = response.get("UnprocessedKeys") or {}
+                    if request_items:
+                        attempt += 1
+                        if attempt > _BATCH_GET_MAX_RETRIES:
+                            self.logger.warning(
+                                f"Giving up on {len(request_items[table_name]['Keys'])} unprocessed bet keys"
+                            )
+                            break
+                        time.sleep(min(0.05 * 2**attempt, 1))
+        except ClientError as e:
+            self.logger.error(f"Error batch fetching {len(unique_keys)} bets: {e}")
+            raise
+
+        bets = self._grade_and_enhance_bets(
+            [
+                self._convert_decimals_to_floats(items_by_key[(key["PK"], key["SK"])])
+                for key in requested
+                if (key["PK"], key["SK"]) in items_by_key
+            ]
+        )
+
+        self.logger.info(f"Retrieved {len(bets)} of {len(requested)} requested bets")
+        return bets
+
     def get_all_bets_for_room(self, room_id: str) -> List[dict]:
         """
         Fetch all bets for a specific room, ordered by point value then user.
         """
         try:
-            response = self.table.query(
+            items = self._query_all(
                 KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
                 ExpressionAttributeValues={
                     ":pk": f"ROOM#{room_id}",
                     ":sk_prefix": "POINT#",
                 },
+                **_BET_PROJECTION,
             )
-            items = response.get("Items", [])
 
             # Convert Decimal values back to float for JSON serialization
             serializable_items = [
@@ -180,15 +530,7 @@ class BetHelper:
             ]
 
             # Check and grade each bet if needed
-            graded_items = []
-            for item in serializable_items:
-                graded_bet = self.check_and_grade_bet(item)
-                if graded_bet:
-                    enhanced_bet = self._enhance_bet_with_game_data(graded_bet)
-                    graded_items.append(enhanced_bet)
-                else:
-                    enhanced_bet = self._enhance_bet_with_game_data(item)
-                    graded_items.append(enhanced_bet)
+            graded_items = self._grade_and_enhance_bets(serializable_items)
 
             self.logger.info(f"Retrieved {len(graded_items)} bets for room {room_id}")
             return graded_items
@@ -201,14 +543,14 @@ class BetHelper:
         Fetch all bets for a specific point value in a room.
         """
         try:
-            response = self.table.query(
+            items = self._query_all(
                 KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
                 ExpressionAttributeValues={
                     ":pk": f"ROOM#{room_id}",
                     ":sk_prefix": f"POINT#{points_wagered}#",
                 },
+                **_BET_PROJECTION,
             )
-            items = response.get("Items", [])
 
             # Convert Decimal values back to float for JSON serialization
             serializable_items = [
@@ -216,15 +558,7 @@ class BetHelper:
             ]
 
             # Check and grade each bet if needed
-            graded_items = []
-            for item in serializable_items:
-                graded_bet = self.check_and_grade_bet(item)
-                if graded_bet:
-                    enhanced_bet = self._enhance_bet_with_game_data(graded_bet)
-                    graded_items.append(enhanced_bet)
-                else:
-                    enhanced_bet = self._enhance_bet_with_game_data(item)
-                    graded_items.append(enhanced_bet)
+            graded_items = self._grade_and_enhance_bets(serializable_items)
 
             self.logger.info(
                 f"Retrieved {len(graded_items)} {points_wagered}-point bets for room {room_id}"
@@ -241,36 +575,22 @@ class BetHelper:
         Get all bets for a specific user in a room (1, 2, and 3 point bets).
         """
         try:
-            response = self.table.query(
-                KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
+            items = self._query_all(
+                IndexName=BET_USER_INDEX,
+                KeyConditionExpression="GSI_PK = :gsi_pk",
                 ExpressionAttributeValues={
-                    ":pk": f"ROOM#{room_id}",
-                    ":sk_prefix": "POINT#",
+                    ":gsi_pk": f"ROOM#{room_id}#USER#{user_id}",
                 },
+                **_BET_PROJECTION,
             )
-            items = response.get("Items", [])
 
             # Convert Decimal values back to float for JSON serialization
             serializable_items = [
                 self._convert_decimals_to_floats(item) for item in items
             ]
 
-            # Filter for user_id in SK
-            user_id_str = f"USER#{user_id}"
-            filtered_items = [
-                item for item in serializable_items if user_id_str in item.get("SK", "")
-            ]
-
             # Check and grade each bet if needed
-            graded_items = []
-            for item in filtered_items:
-                graded_bet = self.check_and_grade_bet(item)
-                if graded_bet:
-                    enhanced_bet = self._enhance_bet_with_game_data(graded_bet)
-                    graded_items.append(enhanced_bet)
-                else:
-                    enhanced_bet = self._enhance_bet_with_game_data(item)
-                    graded_items.append(enhanced_bet)
+            graded_items = self._grade_and_enhance_bets(serializable_items)
 
             self.logger.info(
                 f"Retrieved {len(graded_items)} bets for user {user_id} in room {room_id}"
@@ -294,22 +614,7 @@ class BetHelper:
             List of game IDs the user has placed bets on.
         """
         try:
-            response = self.table.query(
-                KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-                ExpressionAttributeValues={
-                    ":pk": f"ROOM#{room_id}",
-                    ":sk_prefix": f"POINT#",
-                },
-            )
-            items = response.get("Items", [])
-
-            # Filter items for the specific user and extract game IDs
-            user_id_str = f"USER#{user_id}"
-            game_ids = [
-                item["game_id"]
-                for item in items
-                if user_id_str in item.get("SK", "") and "game_id" in item
-            ]
+            game_ids = self._query_user_game_ids(f"ROOM#{room_id}#USER#{user_id}")
 
             self.logger.info(
                 f"Retrieved {len(game_ids)} game IDs for user {user_id} in room {room_id}"
@@ -321,6 +626,18 @@ class BetHelper:
             )
             raise
 
+    def _query_user_game_ids(self, gsi_pk: str) -> List[str]:
+        """
+        Read the game IDs of every bet under a GSI_User partition key.
+        """
+        items = self._query_all(
+            IndexName=BET_USER_INDEX,
+            KeyConditionExpression="GSI_PK = :gsi_pk",
+            ExpressionAttributeValues={":gsi_pk": gsi_pk},
+            ProjectionExpression="game_id",
+        )
+        return [item["game_id"] for item in items if "game_id" in item]
+
     def validate_week_boundary_bet(
         self,
         room_id: str,
@@ -349,14 +666,9 @@ class BetHelper:
         Raises:
             DuplicateBetException: If a duplicate bet exists in the same week
         """
-        from common.helpers.week_helper import WeekHelper
-
         try:
             # Get week boundaries for this sport/league
-            # Pass request_id from self.logger context
-            request_id = getattr(self.logger, "_keys", {}).get("request_id")
-            week_helper = WeekHelper(request_id=request_id)
-            week_boundary = week_helper.get_week_boundary(
+            week_boundary = self._week_helper().get_week_boundary(
                 sport, league, event_datetime, game_id
             )
 
@@ -368,17 +680,19 @@ class BetHelper:
 
             week_start_epoch, week_end_epoch = week_boundary
 
-            # Query for existing bets with same points in this week
+            # Query for existing bets with same points in this week. The event
+            # epoch closes the SK, and epochs share a digit count, so the week
+            # is a contiguous SK range for this point value and user.
+            sk_prefix = f"POINT#{points_wagered}#USER#{user_id}#EVENT#"
             response = self.table.query(
-                KeyConditionExpression="PK = :pk",
-                FilterExpression="contains(SK, :point_user) AND #event_dt BETWEEN :week_start AND :week_end",
+                KeyConditionExpression="PK = :pk AND SK BETWEEN :sk_start AND :sk_end",
                 ExpressionAttributeValues={
                     ":pk": f"ROOM#{room_id}",
-                    ":point_user": f"POINT#{points_wagered}#USER#{user_id}",
-                    ":week_start": week_start_epoch,
-                    ":week_end": week_end_epoch,
+                    ":sk_start": f"{sk_prefix}{week_start_epoch}",
+                    ":sk_end": f"{sk_prefix}{week_end_epoch}",
                 },
-                ExpressionAttributeNames={"#event_dt": "event_datetime"},
+                ProjectionExpression="SK",
+                Limit=1,
             )
 
             existing_bets = response.get("Items", [])
@@ -388,9 +702,7 @@ class BetHelper:
                     f"User {user_id} already has a {points_wagered}-point bet in this week "
                     f"(week boundary: {week_start_epoch} to {week_end_epoch})"
                 )
-                raise DuplicateBetException(
-                    f"You already have a {points_wagered}-point bet placed this week"
-                )
+                raise DuplicateBetException(room_id, user_id, points_wagered)
 
             self.logger.info(
                 f"Bet validation passed for user {user_id}, {points_wagered} points in week "
@@ -427,34 +739,12 @@ class BetHelper:
                 return bet_data
 
             # Get current game data from ESPN
-            request_id = getattr(self.logger, "_keys", {}).get("request_id")
-            espn_client = ESPNClient(request_id=request_id)
-
-            game_data = espn_client.get_event(
-                sport=sport, league=league, event_id=game_id
-            )
+            game = self._get_game(sport, league, game_id)
 
-            if game_data:
-                # Extract team information and scores
-                competitors = game_data.get("competitors", [])
+            if game:
+                game_data, competitors = game
                 status = game_data.get("status", {})
-
-                home_team = None
-                away_team = None
-
-                for competitor in competitors:
-                    team_info = {
-                        "name": competitor.get("name", "Unknown"),
-                        "short_name": competitor.get(
-                            "abbreviation", competitor.get("name", "UNK")[:3].upper()
-                        ),
-                        "score": int(competitor.get("score", 0)),
-                    }
-
-                    if competitor.get("homeAway", "").lower() == "home":
-                        home_team = team_info
-                    elif competitor.get("homeAway", "").lower() == "away":
-                        away_team = team_info
+                home_team, away_team, _ = competitors or (None, None, None)
 
                 # Create structured game status
                 bet_data["game_status"] = {
@@ -514,24 +804,21 @@ class BetHelper:
         )
 
         try:
-            # Get current game status from ESPN
-            espn_client = ESPNClient(request_id=self.request_id)
-
             sport = bet_data["sport"]
             league = bet_data["league"]
             self.logger.info(
                 f"Fetching game data from ESPN for {sport}/{league} game_id: {game_id}"
             )
 
-            game_data = espn_client.get_event(
-                sport=sport, league=league, event_id=game_id
-            )
+            # Get current game status from ESPN
+            game = self._get_game(sport, league, game_id)
 
-            if not game_data:
+            if not game:
                 self.logger.warning(
                     f"Could not fetch game data from ESPN for game_id: {game_id}"
                 )
                 return None
+            game_data, competitors = game
 
             # Log detailed game status information
             status_data = game_data.get("status", {})
@@ -549,16 +836,6 @@ class BetHelper:
             else:
                 bet_data["current_status"] = game_data
 
-            # Persist the updated status to DynamoDB
-            pk = bet_data.get("PK")
-            sk = bet_data.get("SK")
-            if pk and sk:
-                item = self._convert_floats_to_decimals(bet_data)
-                self.table.put_item(Item=item)
-                self.logger.info(
-                    f"Updated odds_snapshot/status in DynamoDB for PK: {pk}, SK: {sk}"
-                )
-
             self.logger.info(
                 f"Game status details - name: '{game_status}', state: '{game_state}', detail: '{game_detail}', completed: {completed}"
             )
@@ -577,6 +854,7 @@ class BetHelper:
                 self.logger.info(
                     f"Game not yet final - status: '{game_status}', state: '{game_state}', detail: '{game_detail}', completed: {completed} - skipping grading"
                 )
+                self._queue_status_write(bet_data)
                 return bet_data
 
             self.logger.info(f"Game is final - proceeding with bet grading")
@@ -588,11 +866,12 @@ class BetHelper:
             points_earned = None
 
             if bet_type == "spread":
-                points_earned = self._grade_spread_bet(bet_data, game_data)
+                points_earned = self._grade_spread_bet(bet_data, competitors)
             elif bet_type == "over_under":
-                points_earned = self._grade_over_under_bet(bet_data, game_data)
+                points_earned = self._grade_over_under_bet(bet_data, competitors)
             else:
                 self.logger.error(f"Unknown bet type: {bet_type}")
+                self._queue_status_write(bet_data)
                 return None
 
             if points_earned is not None:
@@ -609,6 +888,7 @@ class BetHelper:
                 self.logger.warning(
                     f"Bet grading returned None points - no database update performed"
                 )
+                self._queue_status_write(bet_data)
 
         except Exception as e:
             self.logger.error(
@@ -618,13 +898,39 @@ class BetHelper:
 
         return None
 
-    def _grade_spread_bet(self, bet_data: dict, game_data: dict) -> Optional[float]:
+    def _queue_status_write(self, bet_data: dict) -> None:
+        """
+        Queue the refreshed game status of a bet for background persistence.
+
+        Graded bets are written by _update_bet_result instead. The queued write
+        only sets the refreshed field and is skipped once the bet is graded.
+        """
+        pk = bet_data.get("PK")
+        sk = bet_data.get("SK")
+        if pk and sk:
+            # check_and_grade_bet refreshes odds_snapshot.status when the bet
+            # has a snapshot and current_status otherwise
+            if isinstance(bet_data.get("odds_snapshot"), dict):
+                field = "odds_snapshot"
+            else:
+                field = "current_status"
+            value = self._convert_floats_to_decimals(bet_data.get(field))
+            _STATUS_WRITE_QUEUE.put(
+                (self.table.name, {"PK": pk, "SK": sk}, field, value)
+            )
+            self.logger.info(
+                f"Queued odds_snapshot/status update for PK: {pk}, SK: {sk}"
+            )
+
+    def _grade_spread_bet(
+        self, bet_data: dict, competitors: Optional[tuple]
+    ) -> Optional[float]:
         """
         Grade a spread bet based on game results.
 
         Args:
             bet_data: The bet dictionary
-            game_data: Game data from ESPN API
+            competitors: Parsed (home_team, away_team, total_score) from ESPN
 
         Returns:
             Points earned (points_wagered if won, 0 if lost, None if error)
@@ -657,48 +963,26 @@ class BetHelper:
                 f"Grading spread bet: team_choice={selected_team}, spread_value={spread_value}, points_wagered={points_wagered}"
             )
 
-            # Get team scores from game data
-            competitors = game_data.get("competitors", [])
-
-            if not competitors:
-                self.logger.warning(
-                    f"No competitor data found in game_data. Available keys: {list(game_data.keys())}"
-                )
+            # Get team scores from the parsed game data
+            if competitors is None:
                 return None
 
-            home_score = None
-            away_score = None
-            home_team_name = None
-            away_team_name = None
-
-            for competitor in competitors:
-                try:
-                    score = int(competitor.get("score", 0))
-                    team_name = competitor.get("name", "Unknown")
-                    home_away = competitor.get("homeAway", "")
-
-                    if home_away.lower() == "home":
-                        home_score = score
-                        home_team_name = team_name
-                    elif home_away.lower() == "away":
-                        away_score = score
-                        away_team_name = team_name
-
-                    self.logger.info(
-                        f"Team: {team_name} ({home_away}) - Score: {score}"
-                    )
-                except (ValueError, TypeError) as e:
-                    self.logger.error(
-                        f"Error parsing score for competitor {competitor}: {e}"
-                    )
-                    return None
+            home_team, away_team, total_score = competitors
+            if total_score is None:
+                self.logger.warning("No competitor data found in game_data")
+                return None
 
-            if home_score is None or away_score is None:
+            if home_team is None or away_team is None:
                 self.logger.error(
-                    f"Could not extract both team scores - home: {home_score}, away: {away_score}"
+                    f"Could not extract both team scores - home: {home_team}, away: {away_team}"
                 )
                 return None
 
+            home_score = home_team["score"]
+            away_score = away_team["score"]
+            home_team_name = home_team["name"]
+            away_team_name = away_team["name"]
+
             self.logger.info(
                 f"Team scores - Home: {home_team_name} = {home_score}, Away: {away_team_name} = {away_score}"
             )
@@ -739,13 +1023,15 @@ class BetHelper:
             self.logger.error(f"Error grading spread bet: {e}")
             return None
 
-    def _grade_over_under_bet(self, bet_data: dict, game_data: dict) -> Optional[float]:
+    def _grade_over_under_bet(
+        self, bet_data: dict, competitors: Optional[tuple]
+    ) -> Optional[float]:
         """
         Grade an Total bet based on game results.
 
         Args:
             bet_data: The bet dictionary
-            game_data: Game data from ESPN API
+            competitors: Parsed (home_team, away_team, total_score) from ESPN
 
         Returns:
             Points earned (points_wagered if won, 0 if lost, None if error)
@@ -762,37 +1048,16 @@ class BetHelper:
                 f"Grading Total bet: choice={over_under_choice}, line={total_line}, points_wagered={points_wagered}"
             )
 
-            # Get team scores from game data
-            competitors = game_data.get("competitors", [])
-
-            if not competitors:
-                self.logger.warning(
-                    f"No competitor data found in game_data. Available keys: {list(game_data.keys())}"
-                )
+            # Get the combined score from the parsed game data
+            if competitors is None:
                 return None
 
-            total_score = 0
-            team_scores = []
-
-            for competitor in competitors:
-                try:
-                    score = int(competitor.get("score", 0))
-                    team_name = competitor.get("name", "Unknown")
-                    home_away = competitor.get("homeAway", "")
-                    total_score += score
-                    team_scores.append(f"{team_name} ({home_away}): {score}")
-                    self.logger.info(
-                        f"Team: {team_name} ({home_away}) - Score: {score}"
-                    )
-                except (ValueError, TypeError) as e:
-                    self.logger.error(
-                        f"Error parsing score for competitor {competitor}: {e}"
-                    )
-                    return None
+            total_score = competitors[2]
+            if total_score is None:
+                self.logger.warning("No competitor data found in game_data")
+                return None
 
-            self.logger.info(
-                f"Total game score: {total_score} (Teams: {', '.join(team_scores)})"
-            )
+            self.logger.info(f"Total game score: {total_score}")
 
             # Determine if bet won
             if over_under_choice.lower() == "over":
@@ -818,6 +1083,8 @@ class BetHelper:
         """
         Update a bet in DynamoDB with the graded result.
 
+        Only the graded fields and the refreshed game status are written.
+
         Args:
             bet_data: The original bet dictionary
             points_earned: Points earned from the bet
@@ -836,43 +1103,69 @@ class BetHelper:
 
             # Update the bet data
             old_total_points = bet_data.get("total_points_earned")
+            graded_at = int(time.time())
             bet_data["total_points_earned"] = points_earned
-            bet_data["graded_at"] = int(datetime.now().timestamp())
+            bet_data["graded_at"] = graded_at
+
+            update_parts = ["total_points_earned = :t", "graded_at = :g"]
+            expression_names = {}
+            expression_values = {
+                ":t": Decimal(str(points_earned)),
+                ":g": graded_at,
+            }
 
             # Also update the game_bet result and points_earned
             if "game_bet" in bet_data:
                 result_text = "win" if points_earned > 0 else "loss"
                 bet_data["game_bet"]["result"] = result_text
                 bet_data["game_bet"]["points_earned"] = int(points_earned)
+                update_parts.extend(
+                    ["game_bet.#r = :res", "game_bet.points_earned = :pe"]
+                )
+                expression_names["#r"] = "result"
+                expression_values[":res"] = result_text
+                expression_values[":pe"] = int(points_earned)
                 self.logger.info(
                     f"Updated game_bet with result: {result_text}, points_earned: {points_earned}"
                 )
 
+            # Carry the status refreshed by check_and_grade_bet in the same write
+            odds_snapshot = bet_data.get("odds_snapshot")
+            if isinstance(odds_snapshot, dict) and "status" in odds_snapshot:
+                update_parts.append("odds_snapshot.#s = :status")
+                expression_names["#s"] = "status"
+                expression_values[":status"] = self._convert_floats_to_decimals(
+                    odds_snapshot["status"]
+                )
+            elif "current_status" in bet_data:
+                update_parts.append("current_status = :status")
+                expression_values[":status"] = self._convert_floats_to_decimals(
+                    bet_data["current_status"]
+                )
+
             self.logger.info(
                 f"Updated total_points_earned from {old_total_points} to {points_earned}"
             )
 
-            # Convert to DynamoDB format
-            item = self._convert_floats_to_decimals(bet_data)
-
             # Log the key being updated
-            pk = item.get("PK", f"ROOM#{room_id}")
-            sk = item.get("SK", "unknown")
+            pk = bet_data.get("PK", f"ROOM#{room_id}")
+            sk = bet_data.get("SK", "unknown")
             self.logger.info(f"Updating DynamoDB item with PK: {pk}, SK: {sk}")
 
-            # Update in DynamoDB
-            self.table.put_item(Item=item)
+            update_kwargs = {
+                "Key": {"PK": pk, "SK": sk},
+                "UpdateExpression": "SET " + ", ".join(update_parts),
+                "ExpressionAttributeValues": expression_values,
+            }
+            if expression_names:
+                update_kwargs["ExpressionAttributeNames"] = expression_names
 
-            self.logger.info(
-                f"Successfully updated bet in DynamoDB with {points_earned} points earned"
-            )
+            self.table.update_item(**update_kwargs)
 
-            # Return the serializable version
-            updated_item = self._convert_decimals_to_floats(item)
             self.logger.info(
-                f"Returning updated bet data with total_points_earned: {updated_item.get('total_points_earned')}"
+                f"Successfully updated bet in DynamoDB with {points_earned} points earned"
             )
-            return updated_item
+            return bet_data
 
         except Exception as e:
             self.logger.error(
@@ -934,31 +1227,65 @@ class BetHelper:
         self.logger.info(f"Odds snapshot match result: {match}")
         return match
 
-    def reset_bets_for_room(self, room_id: str) -> None:
+    def _room_bet_keys(self, room_id: str, *attributes: str) -> List[dict]:
+        """
+        Fetch the keys (plus any extra attributes) of every bet in a room without
+        grading or enhancing them. Uses the thread-safe client so it can run on a
+        worker thread.
+        """
+        names = ("PK", "SK") + attributes
+        paginator = get_dynamodb_client().get_paginator("query")
+        return [
+            deserialize_item(item)
+            for page in paginator.paginate(
+                TableName=self.table.name,
+                KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
+                ExpressionAttributeValues=serialize_item(
+                    {":pk": f"ROOM#{room_id}", ":sk_prefix": "POINT#"}
+                ),
+                ProjectionExpression=", ".join(f"#{name}" for name in names),
+                ExpressionAttributeNames={f"#{name}": name for name in names},
+            )
+            for item in page.get("Items", [])
+        ]
+
+    def _reset_bet_result(self, key: dict) -> None:
+        """
+        Clear total_points_earned and graded_at on an existing bet so it is
+        graded again and its status refreshes are persisted meanwhile.
+        Uses the thread-safe client so it can run on a worker thread.
+        """
+        get_dynamodb_client().update_item(
+            TableName=self.table.name,
+            Key=serialize_item(key),
+            UpdateExpression="SET total_points_earned = :p REMOVE graded_at",
+            ConditionExpression="attribute_exists(PK)",
+            ExpressionAttributeValues=serialize_item({":p": None}),
+        )
+
+    def reset_bets_for_room(self, room_id: str) -> int:
         """
         Reset all bets in a given room by setting their total_points_earned to None.
 
         Args:
             room_id: The room ID whose bets need to be reset.
+
+        Returns:
+            int: The number of bets reset.
         """
         try:
-            # Fetch all bets for the room
-            bets = self.get_all_bets_for_room(room_id)
-
-            for bet in bets:
-                # Update total_points_earned to None
-                bet["total_points_earned"] = None
+            # Only the keys are needed to reset each bet
+            bet_keys = self._room_bet_keys(room_id)
 
-                # Convert to DynamoDB format and update the item
-                item = self._convert_floats_to_decimals(bet)
-                self.table.put_item(Item=item)
+            for key in bet_keys:
+                self._reset_bet_result(key)
 
                 self.logger.info(
-                    f"Reset total_points_earned for bet with PK: {bet['PK']}, SK: {bet['SK']}"
+                    f"Reset total_points_earned for bet with PK: {key['PK']}, SK: {key['SK']}"
                 )
-            return len(bets)
 
             self.logger.info(f"Successfully reset all bets for room {room_id}")
+            return len(bet_keys)
         except Exception as e:
             self.logger.error(f"Error resetting bets for room {room_id}: {e}")
             raise
@@ -975,27 +1302,19 @@ class BetHelper:
             user_id: The user ID who placed the bet.
             event_datetime: The event datetime for the bet.
         """
+        key = self._bet_key(room_id, points_wagered, user_id, event_datetime)
         try:
-            # Fetch the specific bet
-            bet = self.get_bet(room_id, points_wagered, user_id, event_datetime)
+            self._reset_bet_result(key)
 
-            if not bet:
+            self.logger.info(
+                f"Reset total_points_earned for bet with PK: {key['PK']}, SK: {key['SK']}"
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
                 self.logger.warning(
                     f"No bet found for room_id={room_id}, points_wagered={points_wagered}, user_id={user_id}, event_datetime={event_datetime}"
                 )
                 return
-
-            # Update total_points_earned to None
-            bet["total_points_earned"] = None
-
-            # Convert to DynamoDB format and update the item
-            item = self._convert_floats_to_decimals(bet)
-            self.table.put_item(Item=item)
-
-            self.logger.info(
-                f"Reset total_points_earned for bet with PK: {bet['PK']}, SK: {bet['SK']}"
-            )
-        except Exception as e:
             self.logger.error(
                 f"Error resetting bet for room_id={room_id}, points_wagered={points_wagered}, user_id={user_id}, event_datetime={event_datetime}: {e}"
             )
@@ -1012,21 +1331,23 @@ class BetHelper:
             int: The number of bets updated.
         """
         try:
-            # Fetch all bets for the room
-            bets = self.get_all_bets_for_room(room_id)
+            bets = self._room_bet_keys(room_id, "bet_uuid")
             updated_count = 0
 
             for bet in bets:
                 if "bet_uuid" not in bet:
                     # Generate a UUID for bet_uuid
-                    bet["bet_uuid"] = str(uuid.uuid4())
+                    bet_uuid = str(uuid.uuid4())
 
-                    # Convert to DynamoDB format and update the item
-                    item = self._convert_floats_to_decimals(bet)
-                    self.table.put_item(Item=item)
+                    self.table.update_item(
+                        Key={"PK": bet["PK"], "SK": bet["SK"]},
+                        UpdateExpression="SET bet_uuid = :u",
+                        ConditionExpression="attribute_not_exists(bet_uuid)",
+                        ExpressionAttributeValues={":u": bet_uuid},
+                    )
 
                     self.logger.info(
-                        f"Assigned bet_uuid {bet['bet_uuid']} to bet with PK: {bet['PK']}, SK: {bet['SK']}"
+                        f"Assigned bet_uuid {bet_uuid} to bet with PK: {bet['PK']}, SK: {bet['SK']}"
                     )
                     updated_count += 1
 
@@ -1037,4 +1358,52 @@ class BetHelper:
         except Exception as e:
             self.logger.error(f"Error assigning bet_uuids for room {room_id}: {e}")
             raise
+
+    def assign_user_index_keys(self, room_id: str) -> int:
+        """
+        Backfill the GSI_User key attributes on bets created before the index existed.
+
+        Args:
+            room_id: The room ID whose bets need to be checked and updated.
+
+        Returns:
+            int: The number of bets updated.
+        """
+        try:
+            items = self._query_all(
+                KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
+                ExpressionAttributeValues={
+                    ":pk": f"ROOM#{room_id}",
+                    ":sk_prefix": "POINT#",
+                },
+            )
+            updated_count = 0
+
+            for bet in items:
+                if "GSI_PK" in bet:
+                    continue
+
+                # SK: POINT#{points_wagered}#USER#{user_id}#EVENT#{event_datetime}
+                _, points_wagered, _, user_id, _, event_datetime = bet["SK"].split("#")
+                index_keys = self._user_index_keys(
+                    bet["PK"], user_id, points_wagered, event_datetime
+                )
+                self.table.update_item(
+                    Key={"PK": bet["PK"], "SK": bet["SK"]},
+                    UpdateExpression="SET GSI_PK = :gsi_pk, GSI_SK = :gsi_sk",
+                    ExpressionAttributeValues={
+                        ":gsi_pk": index_keys["GSI_PK"],
+                        ":gsi_sk": index_keys["GSI_SK"],
+                    },
+                )
+                updated_count += 1
+
+            self.logger.info(
+                f"Assigned {BET_USER_INDEX} keys to {updated_count} bets in room {room_id}"
+            )
+            return updated_count
+        except Exception as e:
+            self.logger.error(
+                f"Error assigning {BET_USER_INDEX} keys for room {room_id}: {e}"
+            )
             raise
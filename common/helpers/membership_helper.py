@@ -1,8 +1,17 @@
 from aws_lambda_powertools import Logger
-import boto3
 from botocore.exceptions import ClientError
-from common.models.membership import MembershipModel, MembershipType, MembershipStatus
-from datetime import datetime
+from clients.dynamodb_client import (
+    DEFAULT_TABLE_NAME,
+    deserialize_item,
+    get_dynamodb_client,
+    get_dynamodb_resource,
+    get_table,
+    serialize_item,
+)
+from concurrent.futures import ThreadPoolExecutor
+from common.models.membership import MembershipType, MembershipStatus
+import os
+import time
 from common.helpers.audit_actions_helper import AuditActions, AuditActionHelper
 from exceptions.room_exceptions import (
     RoomNotFoundException,
@@ -11,8 +20,22 @@ from exceptions.room_exceptions import (
     MembershipNotFoundException,
     InvalidMembershipStatusException,
 )
-import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+# GSI keyed by the member (user_id) and "{status}#{membership_type}" so a
+# user's memberships can be queried without scanning the table.
+USER_MEMBERSHIP_INDEX = "UserMembershipIndex"
+
+# Writes that fan out over a room's memberships run on several workers in
+# parallel; the shared resource's connection pool is sized so the workers
+# never wait on a socket.
+_WRITE_WORKERS = 8
+_BATCH_WRITE_SIZE = 25
+_BATCH_WRITE_MAX_RETRIES = 5
+
+# Page size for membership queries; keeps each response small and lets
+# max_items-bounded reads stop early
+_PAGE_SIZE = 500
 
 
 class MembershipHelper:
@@ -21,20 +44,130 @@ class MembershipHelper:
     """
 
     def __init__(self, request_id: str, table_name: str = None):
-        self.dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
-
-        if table_name:
-            self.table = self.dynamodb.Table(table_name)
-        else:
-            table_name = os.getenv("TABLE_NAME", "FortunasBet-UserTable-Testing")
-            self.table = self.dynamodb.Table(table_name)
+        self.dynamodb = get_dynamodb_resource()
+        self.table = get_table(
+            table_name or os.getenv("TABLE_NAME", DEFAULT_TABLE_NAME)
+        )
 
         self.logger = Logger()
         self.logger.append_keys(request_id=request_id)
         self.room_sk = "ROOM"
         self.membership_sk_prefix = "MEMBERSHIP#"
         self.membership_audit_sk = "MEMBERSHIP_AUDIT"
-        self.audit_action_helper = AuditActionHelper(request_id=request_id)
+        self.audit_action_helper = AuditActionHelper(
+            request_id=request_id, table_name=table_name
+        )
+
+    def _query_all(self, max_items: Optional[int] = None, **query_kwargs) -> List[dict]:
+        """
+        Run a query and follow LastEvaluatedKey until every page has been read,
+        or until max_items have been collected.
+        """
+        items = []
+        while True:
+            if max_items:
+                query_kwargs["Limit"] = min(
+                    max_items - len(items), query_kwargs.get("Limit", _PAGE_SIZE)
+                )
+            response = self.table.query(**query_kwargs)
+            items.extend(response.get("Items", []))
+
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key or (max_items and len(items) >= max_items):
+                return items[:max_items] if max_items else items
+            query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+    def _status_type(self, status: str, membership_type: str) -> str:
+        """
+        Build the UserMembershipIndex sort key for a membership.
+        """
+        return f"{status}#{membership_type}"
+
+    def _transact_with_audit(self, operation: dict, **audit_kwargs) -> None:
+        """
+        Run a single TransactWriteItems operation together with the Put of its
+        audit record, so neither is written without the other.
+        """
+        get_dynamodb_client().transact_write_items(
+            TransactItems=[
+                operation,
+                self.audit_action_helper.build_audit_put(**audit_kwargs),
+            ]
+        )
+
+    def build_membership_writes(
+        self,
+        room_id: str,
+        requestor_id: str,
+        room_name: str,
+        membership_type: MembershipType,
+        status: MembershipStatus = MembershipStatus.PENDING,
+        admin_id: Optional[str] = None,
+        invited_user_id: Optional[str] = None,
+        join_date: Optional[int] = None,
+        room_snapshot: Optional[dict] = None,
+    ) -> Tuple[dict, List[dict]]:
+        """
+        Build a new membership and the TransactWriteItems entries that create it
+        together with its audit record, without writing anything.
+        room_snapshot, if given, is a copy of the room header stored on the item
+        so a user's rooms can be listed without reading each room.
+        Returns (membership, transact_items); the membership Put comes first.
+        """
+        current_time = int(time.time())
+
+        # Accept both enum and string inputs
+        mt_value = getattr(membership_type, "value", membership_type)
+        st_value = getattr(status, "value", status)
+        is_invitation = mt_value == MembershipType.INVITATION.value
+
+        # Same invariant MembershipModel enforces on invited_user
+        if is_invitation and not invited_user_id:
+            raise ValueError("invited_user is required for invitations")
+        if not is_invitation and invited_user_id:
+            raise ValueError(
+                "invited_user should not be set for requests, admin, or member memberships"
+            )
+
+        membership = {
+            "admin_id": admin_id,
+            "requestor": requestor_id,
+            "invited_user": invited_user_id,
+            "room_name": room_name,
+            "membership_type": mt_value,
+            "status": st_value,
+            "join_date": join_date,
+            "created_at": current_time,
+        }
+
+        target_user = invited_user_id if is_invitation else requestor_id
+        membership_item = {k: v for k, v in membership.items() if v is not None}
+        membership_item["PK"] = f"ROOM#{room_id}"
+        membership_item["SK"] = f"{self.membership_sk_prefix}{target_user}"
+        membership_item["user_id"] = target_user
+        membership_item["status_type"] = self._status_type(st_value, mt_value)
+        if room_snapshot:
+            membership_item["room_snapshot"] = room_snapshot
+
+        transact_items = [
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": serialize_item(membership_item),
+                    "ConditionExpression": "attribute_not_exists(PK)",
+                }
+            },
+            self.audit_action_helper.build_audit_put(
+                pk=f"ROOM#{room_id}",
+                entity_type="Membership",
+                action=AuditActions.CREATE.value,
+                user_id=requestor_id,
+                sk=self.membership_audit_sk,
+                before=None,
+                after=membership,
+            ),
+        ]
+        return membership, transact_items
 
     def create_membership(
         self,
@@ -46,89 +179,51 @@ class MembershipHelper:
         admin_id: Optional[str] = None,
         invited_user_id: Optional[str] = None,
         join_date: Optional[int] = None,
+        room_snapshot: Optional[dict] = None,
     ) -> dict:
         """
         Create a new membership record.
-        Used for both owner memberships (when creating room) and user requests/invitations.
+        Used for user requests/invitations; room creation writes the owner
+        membership through build_membership_writes.
         """
-        current_time = int(datetime.utcnow().timestamp())
-
-        # Create membership model
-        membership = MembershipModel(
-            admin_id=admin_id,
-            requestor=requestor_id,
-            invited_user=invited_user_id,
+        membership, transact_items = self.build_membership_writes(
+            room_id=room_id,
+            requestor_id=requestor_id,
             room_name=room_name,
             membership_type=membership_type,
             status=status,
+            admin_id=admin_id,
+            invited_user_id=invited_user_id,
             join_date=join_date,
-            created_at=current_time,
-        )
-
-        # Create membership item - use by_alias and exclude_unset to get clean dict
-        membership_item = membership.dict(by_alias=True, exclude_unset=True)
-        membership_item["PK"] = f"ROOM#{room_id}"
-        # Handle both enum and string values for comparison
-        is_invitation = (
-            membership_type == MembershipType.INVITATION
-            or (
-                hasattr(membership_type, "value")
-                and membership_type.value == MembershipType.INVITATION.value
-            )
-            or membership_type == MembershipType.INVITATION.value
-        )
-        target_user = invited_user_id if is_invitation else requestor_id
-        membership_item["SK"] = f"{self.membership_sk_prefix}{target_user}"
-
-        # Convert enum values to strings for DynamoDB (handle both enum and string inputs)
-        membership_item["membership_type"] = (
-            membership_type.value
-            if hasattr(membership_type, "value")
-            else membership_type
+            room_snapshot=room_snapshot,
         )
-        membership_item["status"] = status.value if hasattr(status, "value") else status
+        target_user = membership["invited_user"] or requestor_id
 
         try:
-            self.table.put_item(Item=membership_item)
+            # Write the membership and its audit record atomically
+            get_dynamodb_client().transact_write_items(TransactItems=transact_items)
 
             self.logger.info(
-                f"Created {membership_type.value if hasattr(membership_type, 'value') else membership_type} membership for user {target_user} in room {room_id}"
+                f"Created {membership['membership_type']} membership for user {target_user} in room {room_id}"
             )
 
-            # Create audit record
-            # Create a clean membership dict for audit without enum objects
-            audit_membership = membership.dict(by_alias=True, exclude_unset=True)
-            audit_membership["membership_type"] = (
-                membership_type.value
-                if hasattr(membership_type, "value")
-                else membership_type
-            )
-            audit_membership["status"] = (
-                status.value if hasattr(status, "value") else status
-            )
-
-            self.audit_action_helper.create_audit_record(
-                pk=f"ROOM#{room_id}",
-                entity_type="Membership",
-                action=AuditActions.CREATE.value,
-                user_id=requestor_id,
-                sk=self.membership_audit_sk,
-                before=None,
-                after=audit_membership,  # Use dict instead of model
-            )
-
-            result = membership.dict()
-            # Ensure enums are converted to strings in the result
-            result["membership_type"] = (
-                membership_type.value
-                if hasattr(membership_type, "value")
-                else membership_type
-            )
-            result["status"] = status.value if hasattr(status, "value") else status
+            result = dict(membership)
             result["room_id"] = room_id
             return result
 
         except ClientError as e:
+            # The membership Put is the first item of the transaction
+            reasons = e.response.get("CancellationReasons") or [{}]
+            if (
+                e.response["Error"]["Code"] == "TransactionCanceledException"
+                and reasons[0].get("Code") == "ConditionalCheckFailed"
+            ):
+                self.logger.warning(
+                    f"Membership for user {target_user} in room {room_id} already exists"
+                )
+                raise MembershipAlreadyExistsException(
+                    user_id=target_user, room_id=room_id
+                )
             self.logger.error(f"Error creating membership: {e}")
             raise
 
@@ -153,37 +248,36 @@ class MembershipHelper:
         user_id: str,
         status: MembershipStatus,
         membership_type: MembershipType = None,
+        max_items: Optional[int] = None,
     ) -> List[dict]:
         """
         Get all memberships for a user filtered by status and optionally by membership type.
+        Pass max_items to stop reading once that many memberships have been found.
         """
         try:
-            # Build filter expression based on parameters
-            filter_expr = "begins_with(SK, :sk_prefix) AND ((:user_id = admin_id OR :user_id = requestor OR :user_id = invited_user) AND #status = :status)"
-            expr_attr_values = {
-                ":sk_prefix": self.membership_sk_prefix,
-                ":user_id": user_id,
-                ":status": status.value,
-            }
-            expr_attr_names = {
-                "#status": "status",  # 'status' might be a reserved word
-            }
-
-            # Add membership type filter if specified
-            if membership_type:
-                filter_expr += " AND membership_type = :membership_type"
-                expr_attr_values[":membership_type"] = membership_type.value
+            status_value = getattr(status, "value", status)
+            type_value = getattr(membership_type, "value", membership_type)
+
+            if type_value:
+                key_condition = "user_id = :user_id AND status_type = :status_type"
+                status_type = self._status_type(status_value, type_value)
+            else:
+                key_condition = (
+                    "user_id = :user_id AND begins_with(status_type, :status_type)"
+                )
+                status_type = f"{status_value}#"
 
-            response = self.table.scan(
-                FilterExpression=filter_expr,
-                ExpressionAttributeValues=expr_attr_values,
-                ExpressionAttributeNames=expr_attr_names,
+            memberships = self._query_all(
+                max_items=max_items,
+                IndexName=USER_MEMBERSHIP_INDEX,
+                KeyConditionExpression=key_condition,
+                ExpressionAttributeValues={
+                    ":user_id": user_id,
+                    ":status_type": status_type,
+                },
             )
 
-            memberships = response.get("Items", [])
-            status_desc = f"{status.value}" + (
-                f" {membership_type.value}" if membership_type else ""
-            )
+            status_desc = f"{status_value}" + (f" {type_value}" if type_value else "")
             self.logger.info(
                 f"Found {len(memberships)} {status_desc} memberships for user {user_id}"
             )
@@ -200,39 +294,76 @@ class MembershipHelper:
         Get memberships for a room by status and type.
         """
         try:
-            response = self.table.scan(
-                FilterExpression="PK = :pk AND begins_with(SK, :sk_prefix) AND #status = :status AND membership_type = :type",
+            return self._query_all(
+                KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
+                FilterExpression="#status = :status AND membership_type = :type",
                 ExpressionAttributeValues={
                     ":pk": f"ROOM#{room_id}",
                     ":sk_prefix": self.membership_sk_prefix,
-                    ":status": status.value,
-                    ":type": membership_type.value,
+                    ":status": getattr(status, "value", status),
+                    ":type": getattr(membership_type, "value", membership_type),
                 },
                 ExpressionAttributeNames={"#status": "status"},
             )
 
-            return response.get("Items", [])
+        except ClientError as e:
+            self.logger.error(f"Error getting room memberships: {e}")
+            raise
+
+    def get_room_memberships(
+        self, room_id: str, projection: Optional[List[str]] = None
+    ) -> List[dict]:
+        """
+        Get every membership of a room, whatever its status and type, with a
+        single query. Pass projection to only read the listed attributes.
+        Uses the thread-safe client so it can run on a worker thread.
+        """
+        try:
+            query_kwargs = {
+                "TableName": self.table.name,
+                "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk_prefix)",
+                "ExpressionAttributeValues": serialize_item(
+                    {
+                        ":pk": f"ROOM#{room_id}",
+                        ":sk_prefix": self.membership_sk_prefix,
+                    }
+                ),
+                "PaginationConfig": {"PageSize": _PAGE_SIZE},
+            }
+            if projection:
+                query_kwargs["ProjectionExpression"] = ", ".join(
+                    f"#p{i}" for i in range(len(projection))
+                )
+                query_kwargs["ExpressionAttributeNames"] = {
+                    f"#p{i}": name for i, name in enumerate(projection)
+                }
+
+            paginator = get_dynamodb_client().get_paginator("query")
+            return [
+                deserialize_item(item)
+                for page in paginator.paginate(**query_kwargs)
+                for item in page.get("Items", [])
+            ]
 
         except ClientError as e:
             self.logger.error(f"Error getting room memberships: {e}")
             raise
 
     def invite_user_to_room(
-        self, room_id: str, room_name: str, admin_id: str, invited_user_id: str
+        self,
+        room_id: str,
+        room_name: str,
+        admin_id: str,
+        invited_user_id: str,
+        room_snapshot: Optional[dict] = None,
     ) -> dict:
         """
         Admin invites a user to join a room.
         Creates a pending invitation that the user can accept or decline.
         """
         try:
-            # Check if membership already exists
-            existing_membership = self.get_membership(room_id, invited_user_id)
-            if existing_membership:
-                raise MembershipAlreadyExistsException(
-                    user_id=invited_user_id, room_id=room_id
-                )
-
-            # Create invitation
+            # Create invitation; create_membership raises
+            # MembershipAlreadyExistsException if the membership already exists
             return self.create_membership(
                 room_id=room_id,
                 requestor_id=admin_id,  # Admin is the requestor for invitations
@@ -241,24 +372,27 @@ class MembershipHelper:
                 status=MembershipStatus.PENDING,
                 admin_id=admin_id,
                 invited_user_id=invited_user_id,
+                room_snapshot=room_snapshot,
             )
 
         except ClientError as e:
             self.logger.error(f"Error creating invitation: {e}")
             raise
 
-    def request_to_join_room(self, room_id: str, room_name: str, user_id: str) -> dict:
+    def request_to_join_room(
+        self,
+        room_id: str,
+        room_name: str,
+        user_id: str,
+        room_snapshot: Optional[dict] = None,
+    ) -> dict:
         """
         User requests to join a room.
         Creates a pending request that room admins can approve or deny.
         """
         try:
-            # Check if membership already exists
-            existing_membership = self.get_membership(room_id, user_id)
-            if existing_membership:
-                raise MembershipAlreadyExistsException(user_id=user_id, room_id=room_id)
-
-            # Create request - no admin_id set since it's a user request
+            # Create request - no admin_id set since it's a user request;
+            # create_membership raises MembershipAlreadyExistsException on duplicates
             return self.create_membership(
                 room_id=room_id,
                 requestor_id=user_id,
@@ -266,6 +400,7 @@ class MembershipHelper:
                 membership_type=MembershipType.REQUEST,
                 status=MembershipStatus.PENDING,
                 admin_id=None,  # No specific admin assigned
+                room_snapshot=room_snapshot,
             )
 
         except ClientError as e:
@@ -316,49 +451,56 @@ class MembershipHelper:
             new_status = (
                 MembershipStatus.APPROVED if approve else MembershipStatus.DENIED
             )
-            current_time = int(datetime.utcnow().timestamp())
+            current_time = int(time.time())
 
-            update_expr = "SET #status = :status, admin_id = :admin_id"
+            update_expr = (
+                "SET #status = :status, admin_id = :admin_id, "
+                "user_id = :user_id, status_type = :status_type"
+            )
             expr_attr_names = {"#status": "status"}
             expr_attr_values = {
                 ":status": new_status.value,
                 ":admin_id": responding_user_id,
+                ":user_id": target_user_id,
+                ":status_type": self._status_type(new_status.value, membership_type),
             }
 
             if approve:
                 update_expr += ", join_date = :join_date"
                 expr_attr_values[":join_date"] = current_time
 
-            response = self.table.update_item(
-                Key={
-                    "PK": f"ROOM#{room_id}",
-                    "SK": f"{self.membership_sk_prefix}{target_user_id}",
-                },
-                UpdateExpression=update_expr,
-                ExpressionAttributeNames=expr_attr_names,
-                ExpressionAttributeValues=expr_attr_values,
-                ReturnValues="ALL_NEW",
-            )
-
-            self.logger.info(
-                f"User {responding_user_id} {'approved' if approve else 'denied'} "
-                f"membership for user {target_user_id} in room {room_id}"
+            # The item was just read from DynamoDB, so it already holds plain values
+            before_dict = membership
+
+            # Transactions don't return the updated item, so apply the SETs locally
+            after_dict = dict(before_dict)
+            after_dict.update(
+                {
+                    "status": new_status.value,
+                    "admin_id": responding_user_id,
+                    "user_id": target_user_id,
+                    "status_type": expr_attr_values[":status_type"],
+                }
             )
-
-            # Create audit record
-            # Convert models to clean dicts without enum objects for audit
-            before_dict = dict(membership)
-            if "membership_type" in before_dict and hasattr(
-                before_dict["membership_type"], "value"
-            ):
-                before_dict["membership_type"] = before_dict["membership_type"].value
-            if "status" in before_dict and hasattr(before_dict["status"], "value"):
-                before_dict["status"] = before_dict["status"].value
-
-            after_dict = dict(response["Attributes"])
-            # response["Attributes"] should already have string values from DynamoDB
-
-            self.audit_action_helper.create_audit_record(
+            if approve:
+                after_dict["join_date"] = current_time
+
+            # Update the membership and write its audit record atomically
+            self._transact_with_audit(
+                {
+                    "Update": {
+                        "TableName": self.table.name,
+                        "Key": serialize_item(
+                            {
+                                "PK": f"ROOM#{room_id}",
+                                "SK": f"{self.membership_sk_prefix}{target_user_id}",
+                            }
+                        ),
+                        "UpdateExpression": update_expr,
+                        "ExpressionAttributeNames": expr_attr_names,
+                        "ExpressionAttributeValues": serialize_item(expr_attr_values),
+                    }
+                },
                 pk=f"ROOM#{room_id}",
                 entity_type="Membership",
                 action=AuditActions.UPDATE.value,
@@ -368,7 +510,12 @@ class MembershipHelper:
                 after=after_dict,
             )
 
-            result = response["Attributes"]
+            self.logger.info(
+                f"User {responding_user_id} {'approved' if approve else 'denied'} "
+                f"membership for user {target_user_id} in room {room_id}"
+            )
+
+            result = after_dict
             result["room_id"] = room_id
             return result
 
@@ -405,76 +552,145 @@ class MembershipHelper:
         """
         try:
             # Get all memberships for this room
-            memberships_to_delete = []
-            last_evaluated_key = None
+            memberships = self._query_all(
+                KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
+                ExpressionAttributeValues={
+                    ":pk": f"ROOM#{room_id}",
+                    ":sk_prefix": self.membership_sk_prefix,
+                },
+                ProjectionExpression="PK, SK",
+                Limit=_PAGE_SIZE,
+            )
+            memberships_to_delete = [
+                {"PK": membership["PK"], "SK": membership["SK"]}
+                for membership in memberships
+            ]
+
+            # Delete all memberships, 25 keys per BatchWriteItem request, sharded
+            # across parallel batch writers when there is more than one batch
+            shard_count = min(
+                _WRITE_WORKERS,
+                -(-len(memberships_to_delete) // _BATCH_WRITE_SIZE),
+            )
+            if shard_count > 1:
+                shards = [
+                    memberships_to_delete[i::shard_count] for i in range(shard_count)
+                ]
+                with ThreadPoolExecutor(max_workers=shard_count) as pool:
+                    deleted = sum(pool.map(self._batch_delete, shards))
+                self.logger.info(
+                    f"Deleted {deleted} memberships across {shard_count} batch writers"
+                )
+            else:
+                self._batch_delete(memberships_to_delete)
 
-            while True:
-                scan_kwargs = {
-                    "FilterExpression": "PK = :pk AND begins_with(SK, :sk_prefix)",
-                    "ExpressionAttributeValues": {
-                        ":pk": f"ROOM#{room_id}",
-                        ":sk_prefix": self.membership_sk_prefix,
-                    },
-                }
+            self.logger.info(
+                f"Deleted {len(memberships_to_delete)} memberships for room {room_id}"
+            )
 
-                if last_evaluated_key:
-                    scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+            return len(memberships_to_delete)
 
-                response = self.table.scan(**scan_kwargs)
-                memberships = response.get("Items", [])
+        except ClientError as e:
+            self.logger.error(f"Error deleting memberships for room {room_id}: {e}")
+            raise
 
-                for membership in memberships:
-                    memberships_to_delete.append(
-                        {"PK": membership["PK"], "SK": membership["SK"]}
+    def update_room_snapshots(self, room_id: str, room_snapshot: dict) -> int:
+        """
+        Refresh the room header copied onto every membership of a room.
+        Returns the number of memberships updated.
+        """
+        try:
+            keys = [
+                {"PK": membership["PK"], "SK": membership["SK"]}
+                for membership in self._query_all(
+                    KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
+                    ExpressionAttributeValues={
+                        ":pk": f"ROOM#{room_id}",
+                        ":sk_prefix": self.membership_sk_prefix,
+                    },
+                    ProjectionExpression="PK, SK",
+                    Limit=_PAGE_SIZE,
+                )
+            ]
+
+            def update_snapshot(key: dict) -> None:
+                try:
+                    # Runs on worker threads, so it uses the thread-safe client
+                    get_dynamodb_client().update_item(
+                        TableName=self.table.name,
+                        Key=serialize_item(key),
+                        UpdateExpression="SET room_snapshot = :snapshot, room_name = :room_name",
+                        ConditionExpression="attribute_exists(PK)",
+                        ExpressionAttributeValues=serialize_item(
+                            {
+                                ":snapshot": room_snapshot,
+                                ":room_name": room_snapshot.get("room_name"),
+                            }
+                        ),
                     )
+                except ClientError as e:
+                    # The membership was removed since the query; nothing to refresh
+                    if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                        raise
 
-                last_evaluated_key = response.get("LastEvaluatedKey")
-                if not last_evaluated_key:
-                    break
-
-            # Delete all memberships
-            for membership_key in memberships_to_delete:
-                self.table.delete_item(Key=membership_key)
+            if keys:
+                with ThreadPoolExecutor(
+                    max_workers=min(_WRITE_WORKERS, len(keys))
+                ) as pool:
+                    list(pool.map(update_snapshot, keys))
 
             self.logger.info(
-                f"Deleted {len(memberships_to_delete)} memberships for room {room_id}"
+                f"Refreshed room snapshot on {len(keys)} memberships for room {room_id}"
             )
-
-            return len(memberships_to_delete)
+            return len(keys)
 
         except ClientError as e:
-            self.logger.error(f"Error deleting memberships for room {room_id}: {e}")
+            self.logger.error(
+                f"Error refreshing room snapshots for room {room_id}: {e}"
+            )
             raise
 
+    def _batch_delete(self, keys: List[dict]) -> int:
+        """
+        Delete the given keys 25 per BatchWriteItem, retrying unprocessed deletes
+        with backoff, and return how many were sent. Runs on worker threads, so
+        it uses the thread-safe client rather than a Table batch writer.
+        """
+        client = get_dynamodb_client()
+        table_name = self.table.name
+        for start in range(0, len(keys), _BATCH_WRITE_SIZE):
+            request_items = {
+                table_name: [
+                    {"DeleteRequest": {"Key": serialize_item(key)}}
+                    for key in keys[start : start + _BATCH_WRITE_SIZE]
+                ]
+            }
+            attempt = 0
+            while request_items:
+                response = client.batch_write_item(RequestItems=request_items)
+                request_items = response.get("UnprocessedItems") or {}
+                if request_items:
+                    attempt += 1
+                    if attempt > _BATCH_WRITE_MAX_RETRIES:
+                        raise RuntimeError(
+                            f"{len(request_items[table_name])} membership deletes "
+                            f"left unprocessed after {_BATCH_WRITE_MAX_RETRIES} retries"
+                        )
+                    time.sleep(min(0.05 * 2**attempt, 1))
+        return len(keys)
+
     def get_all_membership_requests_for_user(self, user_id: str) -> List[dict]:
         """
         Get all membership requests where the user is the requestor.
-        Scans for records where PK starts with ROOM# and SK = MEMBERSHIP#{user_id} across all rooms.
+        Queries every MEMBERSHIP#{user_id} record across all rooms from UserMembershipIndex.
         Handles pagination to ensure all results are returned.
         """
         try:
-            all_memberships = []
-            last_evaluated_key = None
-
-            while True:
-                scan_kwargs = {
-                    "FilterExpression": "begins_with(PK, :pk_prefix) AND SK = :sk",
-                    "ExpressionAttributeValues": {
-                        ":pk_prefix": "ROOM#",
-                        ":sk": f"MEMBERSHIP#{user_id}",
-                    },
-                }
-
-                if last_evaluated_key:
-                    scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
-
-                response = self.table.scan(**scan_kwargs)
-                memberships = response.get("Items", [])
-                all_memberships.extend(memberships)
-
-                last_evaluated_key = response.get("LastEvaluatedKey")
-                if not last_evaluated_key:
-                    break
+            all_memberships = self._query_all(
+                IndexName=USER_MEMBERSHIP_INDEX,
+                KeyConditionExpression="user_id = :user_id",
+                ExpressionAttributeValues={":user_id": user_id},
+            )
 
             self.logger.info(
                 f"Found {len(all_memberships)} membership requests for user {user_id}"
@@ -540,15 +756,13 @@ class MembershipHelper:
 
             for room_id in room_ids:
                 # Query for all membership requests in this room
-                membership_response = self.table.scan(
-                    FilterExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
+                room_memberships = self._query_all(
+                    KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
                     ExpressionAttributeValues={
                         ":pk": f"ROOM#{room_id}",
                         ":sk_prefix": self.membership_sk_prefix,
                     },
                 )
-
-                room_memberships = membership_response.get("Items", [])
                 # Add room_id to each membership for context
                 for membership in room_memberships:
                     membership["room_id"] = room_id
@@ -565,3 +779,56 @@ class MembershipHelper:
                 f"Error fetching membership requests for rooms {room_ids}: {e}"
             )
             raise
+
+    def assign_membership_index_keys(self) -> int:
+        """
+        Backfill the UserMembershipIndex attributes on memberships created before the index existed.
+
+        Returns:
+            int: The number of memberships updated.
+        """
+        try:
+            updated_count = 0
+            last_evaluated_key = None
+
+            while True:
+                scan_kwargs = {
+                    "FilterExpression": "begins_with(PK, :pk_prefix) AND begins_with(SK, :sk_prefix) AND attribute_not_exists(status_type)",
+                    "ExpressionAttributeValues": {
+                        ":pk_prefix": "ROOM#",
+                        ":sk_prefix": self.membership_sk_prefix,
+                    },
+                }
+
+                if last_evaluated_key:
+                    scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+                response = self.table.scan(**scan_kwargs)
+
+                for membership in response.get("Items", []):
+                    self.table.update_item(
+                        Key={"PK": membership["PK"], "SK": membership["SK"]},
+                        UpdateExpression="SET user_id = :user_id, status_type = :status_type",
+                        ExpressionAttributeValues={
+                            ":user_id": membership["SK"][
+                                len(self.membership_sk_prefix) :
+                            ],
+                            ":status_type": self._status_type(
+                                membership["status"], membership["membership_type"]
+                            ),
+                        },
+                    )
+                    updated_count += 1
+
+                last_evaluated_key = response.get("LastEvaluatedKey")
+                if not last_evaluated_key:
+                    break
+
+            self.logger.info(
+                f"Assigned {USER_MEMBERSHIP_INDEX} keys to {updated_count} memberships"
+            )
+            return updated_count
+
+        except ClientError as e:
+            self.logger.error(f"Error assigning {USER_MEMBERSHIP_INDEX} keys: {e}")
+            raise
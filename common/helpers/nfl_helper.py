@@ -1,7 +1,159 @@
 from aws_lambda_powertools import Logger
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 import os
+import threading
+import time
+
+# NFL season structure with approximate dates; built once at import since it
+# never changes between calls.
+_NFL_SEASON_INFO = {
+    "preseason": {
+        "season_type": 1,
+        "weeks": 4,
+        "start_month": 8,  # August
+        "start_day": 1,
+        "duration_weeks": 4,
+    },
+    "regular_season": {
+        "season_type": 2,
+        "weeks": 18,
+        "start_month": 9,  # September
+        "start_day": 8,  # Usually starts around first Thursday after Labor Day
+        "duration_weeks": 18,
+    },
+    "playoffs": {
+        "season_type": 3,
+        "weeks": 4,
+        "start_month": 1,  # January (next year)
+        "start_day": 14,  # Usually starts mid-January
+        "duration_weeks": 4,
+    },
+}
+
+_WEEKS_BY_TYPE = {
+    data["season_type"]: data["weeks"] for data in _NFL_SEASON_INFO.values()
+}
+_VALID_SEASON_TYPES = frozenset(_WEEKS_BY_TYPE)
+
+_ONE_WEEK_SECONDS = 7 * 24 * 60 * 60
+# Distance from a week's start to its end (see _week_epochs)
+_WEEK_SPAN_SECONDS = 6 * 24 * 60 * 60
+
+# ESPN adds events to a season's schedule as it goes (playoff games once the
+# matchups are set), so each year's indexed schedule is kept for an hour
+_SCHEDULE_TTL_SECONDS = 3600
+_SCHEDULE_CACHE: Dict[int, Tuple[float, Dict[str, Dict]]] = {}
+_SCHEDULE_LOCK = threading.Lock()
+
+# get_current_nfl_week result for the current hour, keyed by epoch // 3600
+_CURRENT_WEEK_CACHE: Dict[int, Optional[Dict]] = {}
+
+
+@lru_cache(maxsize=256)
+def _season_start_epoch(year: int, season_type: int) -> int:
+    """
+    Epoch of week 1's start for the given NFL season year and season type.
+    """
+    season_info = _NFL_SEASON_INFO
+
+    if season_type == 1:  # Preseason
+        season_data = season_info["preseason"]
+        start_date = datetime(
+            year, season_data["start_month"], season_data["start_day"]
+        )
+    elif season_type == 2:  # Regular season
+        season_data = season_info["regular_season"]
+        start_date = datetime(
+            year, season_data["start_month"], season_data["start_day"]
+        )
+    elif season_type == 3:  # Playoffs
+        season_data = season_info["playoffs"]
+        # Playoffs are in the year AFTER the season year
+        start_date = datetime(
+            year + 1, season_data["start_month"], season_data["start_day"]
+        )
+    else:
+        raise ValueError(f"Invalid season_type: {season_type}")
+
+    return int(start_date.timestamp())
+
+
+def _week_epochs(year: int, season_type: int, week: int) -> Tuple[int, int]:
+    """
+    (week_start_epoch, week_end_epoch) for a 1-indexed week; weeks run Sunday
+    to Saturday, so the end is six days after the start.
+    """
+    week_start = _season_start_epoch(year, season_type) + (week - 1) * _ONE_WEEK_SECONDS
+    return week_start, week_start + _WEEK_SPAN_SECONDS
+
+
+def _week_info(
+    year: int, season_name: str, season_type: int, week: int, include_iso: bool = True
+) -> Dict:
+    """
+    Week dictionary returned by find_nfl_weeks_in_range and get_current_nfl_week.
+    The week_start/week_end ISO strings are only built when include_iso is set.
+    """
+    week_start_epoch, week_end_epoch = _week_epochs(year, season_type, week)
+    week_info = {
+        "year": year,
+        "season_type": season_type,
+        "season_name": season_name,
+        "week": week,
+        "week_start_epoch": week_start_epoch,
+        "week_end_epoch": week_end_epoch,
+    }
+    if include_iso:
+        week_info["week_start"] = datetime.fromtimestamp(week_start_epoch).isoformat()
+        week_info["week_end"] = datetime.fromtimestamp(week_end_epoch).isoformat()
+    return week_info
+
+
+def _get_schedule_index(year: int, request_id: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Return the ESPN NFL schedule for a season indexed by game ID, cached for an
+    hour so events ESPN adds later in the season are picked up. Raises
+    LookupError when no schedule is available so the failure is not cached.
+    """
+    with _SCHEDULE_LOCK:
+        cached = _SCHEDULE_CACHE.get(year)
+        if cached and time.monotonic() - cached[0] < _SCHEDULE_TTL_SECONDS:
+            return cached[1]
+
+        from clients.espn_client import ESPNClient
+
+        # Fetch under the lock so concurrent cold misses share one request
+        schedule_data = ESPNClient(request_id=request_id).get_nfl_schedule(year)
+        if not schedule_data or "events" not in schedule_data:
+            raise LookupError(f"No schedule data found for year {year}")
+
+        schedule_index = {event.get("id"): event for event in schedule_data["events"]}
+        _SCHEDULE_CACHE[year] = (time.monotonic(), schedule_index)
+        return schedule_index
+
+
+def _week_boundary(
+    game_id: str, year: int, request_id: Optional[str] = None
+) -> Optional[Tuple[int, int]]:
+    """
+    (week_start_epoch, week_end_epoch) for a game, or None when the game or its
+    week info is missing from the schedule. Read from the hourly schedule
+    cache, so a game ESPN adds later is found once the schedule is refreshed;
+    schedule fetch failures raise LookupError.
+    """
+    event = _get_schedule_index(year, request_id).get(game_id)
+    if event is None:
+        return None
+
+    season = event.get("season", {})
+    week_num = season.get("week")
+    season_type = season.get("type")
+    if not week_num or not season_type:
+        return None
+
+    return _week_epochs(year, season_type, week_num)
 
 
 class NFLHelper:
@@ -12,35 +164,14 @@ class NFLHelper:
     def __init__(self, request_id: str):
         self.logger = Logger()
         self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
 
     def get_nfl_season_info(self) -> Dict:
         """
         Returns NFL season structure with approximate dates.
         Note: These are approximate dates and may vary slightly year to year.
         """
-        return {
-            "preseason": {
-                "season_type": 1,
-                "weeks": 4,
-                "start_month": 8,  # August
-                "start_day": 1,
-                "duration_weeks": 4,
-            },
-            "regular_season": {
-                "season_type": 2,
-                "weeks": 18,
-                "start_month": 9,  # September
-                "start_day": 8,  # Usually starts around first Thursday after Labor Day
-                "duration_weeks": 18,
-            },
-            "playoffs": {
-                "season_type": 3,
-                "weeks": 4,
-                "start_month": 1,  # January (next year)
-                "start_day": 14,  # Usually starts mid-January
-                "duration_weeks": 4,
-            },
-        }
+        return _NFL_SEASON_INFO
 
     def get_week_dates_for_season(
         self, year: int, season_type: int, week: int
@@ -59,93 +190,86 @@ class NFLHelper:
         Raises:
             ValueError: If invalid season_type provided
         """
-        season_info = self.get_nfl_season_info()
-
-        if season_type == 1:  # Preseason
-            season_data = season_info["preseason"]
-            start_date = datetime(
-                year, season_data["start_month"], season_data["start_day"]
-            )
-        elif season_type == 2:  # Regular season
-            season_data = season_info["regular_season"]
-            start_date = datetime(
-                year, season_data["start_month"], season_data["start_day"]
-            )
-        elif season_type == 3:  # Playoffs
-            season_data = season_info["playoffs"]
-            # Playoffs are in the year AFTER the season year
-            start_date = datetime(
-                year + 1, season_data["start_month"], season_data["start_day"]
-            )
-        else:
-            raise ValueError(f"Invalid season_type: {season_type}")
+        week_start, week_end = _week_epochs(year, season_type, week)
+        return datetime.fromtimestamp(week_start), datetime.fromtimestamp(week_end)
 
-        # Calculate the start of the specific week (weeks are 1-indexed)
-        week_start = start_date + timedelta(weeks=(week - 1))
-        week_end = week_start + timedelta(days=6)  # Week runs Sunday to Saturday
+    def get_week_epochs_for_season(
+        self, year: int, season_type: int, week: int
+    ) -> Tuple[int, int]:
+        """
+        Same as get_week_dates_for_season, but returns epoch seconds.
 
-        return week_start, week_end
+        Raises:
+            ValueError: If invalid season_type provided
+        """
+        return _week_epochs(year, season_type, week)
 
-    def find_nfl_weeks_in_range(self, start_epoch: int, end_epoch: int) -> List[Dict]:
+    def find_nfl_weeks_in_range(
+        self, start_epoch: int, end_epoch: int, include_iso: bool = False
+    ) -> List[Dict]:
         """
         Find all NFL weeks that fall within the given date range.
 
         Args:
             start_epoch: Start date in epoch timestamp
             end_epoch: End date in epoch timestamp
+            include_iso: Also include week_start/week_end ISO strings
 
         Returns:
             List of dictionaries containing week information
         """
+        return list(self.iter_nfl_weeks_in_range(start_epoch, end_epoch, include_iso))
+
+    def iter_nfl_weeks_in_range(
+        self, start_epoch: int, end_epoch: int, include_iso: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Yield the NFL weeks that fall within the given date range, ordered by
+        year, season_type and week, so callers that only need the first match
+        can stop early.
+
+        Args:
+            start_epoch: Start date in epoch timestamp
+            end_epoch: End date in epoch timestamp
+            include_iso: Also include week_start/week_end ISO strings
+        """
         start_date = datetime.fromtimestamp(start_epoch)
         end_date = datetime.fromtimestamp(end_epoch)
 
-        self.logger.info(f"Finding NFL weeks between {start_date} and {end_date}")
+        self.logger.info("Finding NFL weeks between %s and %s", start_date, end_date)
 
-        weeks_in_range = []
-        season_info = self.get_nfl_season_info()
+        season_info = _NFL_SEASON_INFO
 
         # Check multiple years to cover the range
         start_year = start_date.year
         end_year = end_date.year
 
-        # Extend the year range to handle edge cases
-        for year in range(start_year - 1, end_year + 2):
+        # A season's weeks run from August of its year into the next January, so
+        # only seasons starting from the year before the range can overlap it.
+        # Years and weeks are iterated ascending, and _NFL_SEASON_INFO is defined
+        # in season_type order, so weeks come out already sorted.
+        for year in range(start_year - 1, end_year + 1):
             for season_name, season_data in season_info.items():
                 season_type = season_data["season_type"]
                 max_weeks = season_data["weeks"]
 
-                for week in range(1, max_weeks + 1):
-                    try:
-                        week_start, week_end = self.get_week_dates_for_season(
-                            year, season_type, week
-                        )
-
-                        # Check if this week overlaps with our date range
-                        if week_start <= end_date and week_end >= start_date:
-                            weeks_in_range.append(
-                                {
-                                    "year": year,
-                                    "season_type": season_type,
-                                    "season_name": season_name,
-                                    "week": week,
-                                    "week_start": week_start.isoformat(),
-                                    "week_end": week_end.isoformat(),
-                                    "week_start_epoch": int(week_start.timestamp()),
-                                    "week_end_epoch": int(week_end.timestamp()),
-                                }
-                            )
-
-                    except ValueError as e:
-                        self.logger.warning(
-                            f"Error calculating dates for year {year}, season {season_type}, week {week}: {e}"
-                        )
-                        continue
-
-        # Sort by year, season_type, and week
-        weeks_in_range.sort(key=lambda x: (x["year"], x["season_type"], x["week"]))
-
-        return weeks_in_range
+                # Week N runs from season_start + (N-1) weeks for 6 days, so the
+                # overlapping weeks can be computed with integer epoch arithmetic
+                season_start = _season_start_epoch(year, season_type)
+                first_week = max(
+                    1,
+                    -(
+                        (season_start - start_epoch + _WEEK_SPAN_SECONDS)
+                        // _ONE_WEEK_SECONDS
+                    )
+                    + 1,
+                )
+                last_week = min(
+                    max_weeks, (end_epoch - season_start) // _ONE_WEEK_SECONDS + 1
+                )
+
+                for week in range(first_week, last_week + 1):
+                    yield _week_info(year, season_name, season_type, week, include_iso)
 
     def group_weeks_by_season(self, weeks: List[Dict]) -> List[Dict]:
         """
@@ -183,19 +307,10 @@ class NFLHelper:
         Returns:
             bool: True if valid, False otherwise
         """
-        season_info = self.get_nfl_season_info()
-
-        # Check if season_type is valid
-        valid_season_types = [data["season_type"] for data in season_info.values()]
-        if season_type not in valid_season_types:
-            return False
-
-        # Check if week is in valid range for the season type
-        for season_data in season_info.values():
-            if season_data["season_type"] == season_type:
-                return 1 <= week <= season_data["weeks"]
-
-        return False
+        return (
+            season_type in _VALID_SEASON_TYPES
+            and 1 <= week <= _WEEKS_BY_TYPE[season_type]
+        )
 
     def get_current_nfl_week(self) -> Optional[Dict]:
         """
@@ -204,20 +319,35 @@ class NFLHelper:
         Returns:
             Dictionary with current week info or None if not in season
         """
-        current_epoch = int(datetime.now().timestamp())
-
-        # Look for current week in a small range around today
-        start_epoch = current_epoch - (7 * 24 * 60 * 60)  # One week before
-        end_epoch = current_epoch + (7 * 24 * 60 * 60)  # One week after
-
-        weeks = self.find_nfl_weeks_in_range(start_epoch, end_epoch)
-
-        # Find the week that contains today
-        for week in weeks:
-            if week["week_start_epoch"] <= current_epoch <= week["week_end_epoch"]:
-                return week
-
-        return None
+        current_epoch = int(time.time())
+
+        # The answer only changes at week boundaries, so reuse it for the hour
+        hour_bucket = current_epoch // 3600
+        if hour_bucket in _CURRENT_WEEK_CACHE:
+            current_week = _CURRENT_WEEK_CACHE[hour_bucket]
+            return dict(current_week) if current_week else None
+
+        # Today can only fall in a season that started this year or last year;
+        # compute the week index directly for each and check it contains today
+        current_year = datetime.fromtimestamp(current_epoch).year
+        current_week = None
+        for year in (current_year - 1, current_year):
+            for season_name, season_data in _NFL_SEASON_INFO.items():
+                season_type = season_data["season_type"]
+                offset = current_epoch - _season_start_epoch(year, season_type)
+                week = offset // _ONE_WEEK_SECONDS + 1
+                if (
+                    1 <= week <= season_data["weeks"]
+                    and offset % _ONE_WEEK_SECONDS <= _WEEK_SPAN_SECONDS
+                ):
+                    current_week = _week_info(year, season_name, season_type, week)
+                    break
+            if current_week:
+                break
+
+        _CURRENT_WEEK_CACHE.clear()
+        _CURRENT_WEEK_CACHE[hour_bucket] = current_week
+        return dict(current_week) if current_week else None
 
     def find_nfl_week_by_game_id(self, game_id: str, year: int) -> Optional[Dict]:
         """
@@ -230,42 +360,33 @@ class NFLHelper:
         Returns:
             Dictionary with week info or None if not found
         """
-        from clients.espn_client import ESPNClient
-
         try:
-            # Pass request_id from logger context
-            request_id = getattr(self.logger, "_keys", {}).get("request_id")
-            espn_client = ESPNClient(request_id=request_id)
-            schedule_data = espn_client.get_nfl_schedule(year)
-
-            if not schedule_data or "events" not in schedule_data:
-                self.logger.warning(f"No schedule data found for year {year}")
-                return None
-
-            # Search through all events to find the one with matching game_id
-            for event in schedule_data["events"]:
-                if event.get("id") == game_id:
-                    # Extract week information from the event
-                    season = event.get("season", {})
-                    week_info = {
-                        "game_id": game_id,
-                        "week": season.get("week"),
-                        "season_type": season.get("type"),
-                        "year": season.get("year"),
-                        "event_date": event.get("date"),
-                        "name": event.get("name", ""),
-                    }
-
-                    self.logger.info(f"Found week info for game {game_id}: {week_info}")
-                    return week_info
-
-            self.logger.warning(f"Game ID {game_id} not found in {year} schedule")
+            event = _get_schedule_index(year, self.request_id).get(game_id)
+        except LookupError:
+            self.logger.warning(f"No schedule data found for year {year}")
             return None
-
         except Exception as e:
             self.logger.error(f"Error finding NFL week for game {game_id}: {e}")
             return None
 
+        if event is None:
+            self.logger.warning(f"Game ID {game_id} not found in {year} schedule")
+            return None
+
+        # Extract week information from the event
+        season = event.get("season", {})
+        week_info = {
+            "game_id": game_id,
+            "week": season.get("week"),
+            "season_type": season.get("type"),
+            "year": season.get("year"),
+            "event_date": event.get("date"),
+            "name": event.get("name", ""),
+        }
+
+        self.logger.info(f"Found week info for game {game_id}: {week_info}")
+        return week_info
+
     def get_week_boundary_by_game_id(self, game_id: str, year: int) -> Optional[tuple]:
         """
         Get the week start and end boundaries for a specific game.
@@ -277,38 +398,31 @@ class NFLHelper:
         Returns:
             tuple: (week_start_epoch, week_end_epoch) or None if not found
         """
-        week_info = self.find_nfl_week_by_game_id(game_id, year)
-
-        if not week_info:
-            return None
+        return self._compute_week_boundary(game_id, year)
 
+    def _compute_week_boundary(self, game_id: str, year: int) -> Optional[tuple]:
+        """
+        Look the game's week boundary up in the cached schedule, logging why
+        when none can be found.
+        """
         try:
-            week_num = week_info["week"]
-            season_type = week_info["season_type"]
-
-            if not week_num or not season_type:
-                self.logger.warning(
-                    f"Missing week or season_type info for game {game_id}"
-                )
-                return None
-
-            # Get the week dates
-            week_start_dt, week_end_dt = self.get_week_dates_for_season(
-                year, season_type, week_num
-            )
-
-            # Convert to epoch timestamps
-            week_start_epoch = int(week_start_dt.timestamp())
-            week_end_epoch = int(week_end_dt.timestamp())
-
-            self.logger.info(
-                f"Week boundary for game {game_id}: {week_start_epoch} to {week_end_epoch}"
-            )
-
-            return week_start_epoch, week_end_epoch
-
+            week_boundary = _week_boundary(game_id, year, self.request_id)
+        except LookupError as e:
+            self.logger.warning(str(e))
+            return None
         except Exception as e:
             self.logger.error(
                 f"Error calculating week boundary for game {game_id}: {e}"
             )
             return None
+
+        if week_boundary is None:
+            self.logger.warning(
+                f"Game ID {game_id} not found in {year} schedule or missing week info"
+            )
+            return None
+
+        self.logger.info(
+            f"Week boundary for game {game_id}: {week_boundary[0]} to {week_boundary[1]}"
+        )
+        return week_boundary
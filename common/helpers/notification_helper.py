@@ -1,32 +1,36 @@
 import time
 import uuid
-from typing import Optional
-import boto3
+from typing import List, Optional, Tuple
 from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+from clients.dynamodb_client import get_dynamodb_resource, get_table
 from common.models.notification_model import NotificationModel
 from common.models.notification_model import NotificationType
 from aws_lambda_powertools import Logger
-import os
+
+NOTIFICATION_SK_PREFIX = "NOTIFICATION#"
 
 
 class NotificationHelper:
     def __init__(self, request_id: str):
-        self.dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
-        table_name = os.getenv("TABLE_NAME")
-        self.table = self.dynamodb.Table(table_name)
+        self.dynamodb = get_dynamodb_resource()
+        self.table = get_table()
         self.logger = Logger()
         self.logger.append_keys(request_id=request_id)
 
-    def create_notification(
-        self, user_id: str, message: str, notification_type: NotificationType
-    ) -> NotificationModel:
+    def _build_notification(
+        self,
+        pk: str,
+        message: str,
+        notification_type: NotificationType,
+        timestamp: int,
+    ) -> tuple:
         """
-        Create a notification for a user.
-        notification_type should be a NotificationType enum or its value (str).
+        Build the (model, DynamoDB item) pair for a new notification under pk.
         """
         notification_id = str(uuid.uuid4())
-        timestamp = int(time.time())
         # Accept both enum and str for notification_type
+        nt_value = getattr(notification_type, "value", notification_type)
 
         notification = NotificationModel(
             view=False,
@@ -34,60 +38,128 @@ class NotificationHelper:
             notification_type=notification_type,
             timestamp=timestamp,
         )
-        pk = NotificationModel.create_pk(user_id)
-        sk = NotificationModel.create_sk(notification_id)
         item = {
             "PK": pk,
-            "SK": sk,
+            # Same key as NotificationModel.create_sk, without the format call
+            "SK": NOTIFICATION_SK_PREFIX + notification_id,
             "view": notification.view,
             "message": notification.message,
-            "notification_type": notification.notification_type.value,
+            "notification_type": nt_value,
             "timestamp": notification.timestamp,
         }
+        return notification, item
+
+    def create_notification(
+        self, user_id: str, message: str, notification_type: NotificationType
+    ) -> NotificationModel:
+        """
+        Create a notification for a user.
+        notification_type should be a NotificationType enum or its value (str).
+        """
+        notification, item = self._build_notification(
+            NotificationModel.create_pk(user_id),
+            message,
+            notification_type,
+            int(time.time()),
+        )
         self.table.put_item(Item=item)
         if self.logger:
             self.logger.info(
-                f"Notification created for user {user_id}: {message} [{notification_type.value}]"
+                "Notification created for user %s: %s [%s]",
+                user_id,
+                message,
+                item["notification_type"],
             )
         return notification
 
+    def create_notifications(
+        self, payloads: List[Tuple[str, str, NotificationType]]
+    ) -> List[NotificationModel]:
+        """
+        Create several notifications at once.
+        payloads is a list of (user_id, message, notification_type) tuples; the
+        items are written with a batch writer, up to 25 per BatchWriteItem call.
+        """
+        timestamp = int(time.time())
+        notifications = []
+        pks = {}
+        with self.table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+            for user_id, message, notification_type in payloads:
+                pk = pks.get(user_id)
+                if pk is None:
+                    pk = pks[user_id] = NotificationModel.create_pk(user_id)
+                notification, item = self._build_notification(
+                    pk, message, notification_type, timestamp
+                )
+                batch.put_item(Item=item)
+                notifications.append(notification)
+        if self.logger:
+            self.logger.info("Created %d notifications", len(notifications))
+        return notifications
+
     def acknowledge_notification(self, user_id: str, notification_id: str) -> bool:
         pk = NotificationModel.create_pk(user_id)
         sk = NotificationModel.create_sk(notification_id)
-        response = self.table.update_item(
-            Key={"PK": pk, "SK": sk},
-            UpdateExpression="SET #v = :true",
-            ExpressionAttributeNames={"#v": "view"},
-            ExpressionAttributeValues={":true": True},
-            ReturnValues="UPDATED_NEW",
-        )
+        try:
+            # Only write when the notification hasn't been acknowledged yet
+            response = self.table.update_item(
+                Key={"PK": pk, "SK": sk},
+                UpdateExpression="SET #v = :true",
+                ConditionExpression="attribute_not_exists(#v) OR #v = :false",
+                ExpressionAttributeNames={"#v": "view"},
+                ExpressionAttributeValues={":true": True, ":false": False},
+                ReturnValues="UPDATED_NEW",
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                self.logger.info(
+                    "Notification %s for user %s already acknowledged.",
+                    notification_id,
+                    user_id,
+                )
+                return True
+            raise
         updated = response.get("Attributes", {}).get("view", False)
         if self.logger:
             self.logger.info(
-                f"Notification {notification_id} for user {user_id} acknowledged."
+                "Notification %s for user %s acknowledged.", notification_id, user_id
             )
         return updated
 
-    def get_notifications(self, user_id: str) -> list[NotificationModel]:
+    def get_notifications(
+        self, user_id: str, limit: Optional[int] = None
+    ) -> list[NotificationModel]:
+        """
+        Get a user's notifications, reading only the attributes the client uses.
+        Pass limit to stop once that many notifications have been read.
+        """
         pk = NotificationModel.create_pk(user_id)
         notifications = []
         last_evaluated_key = None
-        self.logger.info(f"Retrieving notifications for user {user_id} with PK: {pk}")
+        self.logger.info(
+            "Retrieving notifications for user %s with PK: %s", user_id, pk
+        )
         while True:
             query_kwargs = {
                 "KeyConditionExpression": Key("PK").eq(pk)
-                & Key("SK").begins_with("NOTIFICATION#")
+                & Key("SK").begins_with(NOTIFICATION_SK_PREFIX),
+                # SK carries the notification id needed to acknowledge it
+                "ProjectionExpression": "SK, #v, message, #ts, notification_type",
+                "ExpressionAttributeNames": {"#v": "view", "#ts": "timestamp"},
             }
+            if limit:
+                query_kwargs["Limit"] = limit - len(notifications)
             if last_evaluated_key:
                 query_kwargs["ExclusiveStartKey"] = last_evaluated_key
             response = self.table.query(**query_kwargs)
-            self.logger.info(f"Query response: {response}")
-            notifications.extend([response.get("Items", [])])
+            notifications.extend(response.get("Items", []))
             last_evaluated_key = response.get("LastEvaluatedKey")
-            if not last_evaluated_key:
+            if not last_evaluated_key or (limit and len(notifications) >= limit):
                 break
         if self.logger:
             self.logger.info(
-                f"Retrieved {len(notifications)} notifications for user {user_id} (with pagination)."
+                "Retrieved %d notifications for user %s (with pagination).",
+                len(notifications),
+                user_id,
             )
         return notifications
@@ -1,19 +1,74 @@
 from aws_lambda_powertools import Logger
-import boto3
 from botocore.exceptions import ClientError
+from clients.dynamodb_client import (
+    get_dynamodb_client,
+    get_dynamodb_resource,
+    deserialize_item,
+    get_table,
+    serialize_item,
+)
 from common.models.room import RoomModel
 from common.models.membership import MembershipType, MembershipStatus
-from datetime import datetime
 from common.helpers.audit_actions_helper import AuditActions, AuditActionHelper
 from common.helpers.membership_helper import MembershipHelper
+from concurrent.futures import ThreadPoolExecutor
 from exceptions.room_exceptions import (
+    EmptyAdminsListException,
+    InvalidDateRangeException,
     RoomNotFoundException,
     UnauthorizedRoomAccessException,
     MembershipNotFoundException,
 )
 import os
 import random
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+ROOM_PK_PREFIX = "ROOM#"
+ROOM_PK_PREFIX_LEN = len(ROOM_PK_PREFIX)
+ROOM_SK = "ROOM"
+
+_BATCH_GET_SIZE = 100
+_BATCH_GET_MAX_RETRIES = 5
+_BATCH_GET_WORKERS = 8
+
+# Rooms read by get_room are kept for a short while so repeated lookups in a
+# warm container skip the GetItem. Set ROOM_CACHE_TTL=0 to turn this off.
+_ROOM_CACHE_TTL = float(os.getenv("ROOM_CACHE_TTL", "30"))
+_ROOM_CACHE_MAX_SIZE = 1024
+_ROOM_CACHE: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+_ROOM_CACHE_LOCK = threading.Lock()
+
+# Room header fields copied onto each membership as room_snapshot, so listing
+# a user's rooms needs only the membership query
+_ROOM_SNAPSHOT_FIELDS = (
+    "room_name",
+    "leagues",
+    "created_at",
+    "owner_id",
+    "public",
+    "description",
+    "admins",
+    "start_date",
+    "end_date",
+    "archived",
+)
+
+
+def _room_pk(room_id: str) -> str:
+    """
+    Build the partition key shared by a room and its memberships.
+    """
+    return ROOM_PK_PREFIX + room_id
+
+
+def _room_key(room_id: str) -> dict:
+    """
+    Build the primary key of a room item. A fresh dict each call, since boto3
+    may transform the Key it is given.
+    """
+    return {"PK": ROOM_PK_PREFIX + room_id, "SK": ROOM_SK}
 
 
 class RoomHelper:
@@ -22,15 +77,11 @@ class RoomHelper:
     """
 
     def __init__(self, request_id: str, table_name: str = None):
-        self.dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
-        if table_name:
-            self.table = self.dynamodb.Table(table_name)
-        else:
-            table_name = os.getenv("TABLE_NAME")
-            self.table = self.dynamodb.Table(table_name)
+        self.dynamodb = get_dynamodb_resource()
+        self.table = get_table(table_name)
         self.logger = Logger()
         self.logger.append_keys(request_id=request_id)
-        self.room_sk = "ROOM"
+        self.room_sk = ROOM_SK
         self.room_audit_sk = "ROOM_AUDIT"
 
         self.audit_action_helper = AuditActionHelper(
@@ -57,7 +108,7 @@ class RoomHelper:
         """
         # Generate a random 10-digit room ID
         room_id = str(random.randint(1000000000, 9999999999))
-        current_time = int(datetime.utcnow().timestamp())
+        current_time = int(time.time())
 
         # Create room model - owner is automatically the admin
         room = RoomModel(
@@ -72,82 +123,214 @@ class RoomHelper:
             end_date=end_date,
         )
 
-        # Create room item
-        room_item = room.dict()
-        room_item["PK"] = f"ROOM#{room_id}"
-        room_item["SK"] = self.room_sk
+        # Serialize the model once; the item, audit record and result share it
+        room_data = room.dict()
+        room_item = {**room_data, "PK": _room_pk(room_id), "SK": self.room_sk}
+
+        # The owner is the admin who approves their own membership
+        _, membership_writes = self.membership_helper.build_membership_writes(
+            room_id=room_id,
+            requestor_id=owner_id,
+            room_name=room_name,
+            membership_type=MembershipType.REQUEST,
+            status=MembershipStatus.APPROVED,
+            admin_id=owner_id,
+            join_date=current_time,
+            room_snapshot=self._room_snapshot(room_data),
+        )
 
         try:
-            # Create room and membership
-            self.table.put_item(Item=room_item)
-
-            # Create membership for the owner using MembershipHelper
-            self.membership_helper.create_membership(
-                room_id=room_id,
-                requestor_id=owner_id,
-                room_name=room_name,
-                membership_type=MembershipType.REQUEST,
-                status=MembershipStatus.APPROVED,
-                admin_id=owner_id,  # Owner is the admin who approves their own membership
-                join_date=current_time,
+            # Write the room, the owner membership and both audit records atomically
+            get_dynamodb_client().transact_write_items(
+                TransactItems=[
+                    {
+                        "Put": {
+                            "TableName": self.table.name,
+                            "Item": serialize_item(room_item),
+                            "ConditionExpression": "attribute_not_exists(PK)",
+                        }
+                    },
+                    *membership_writes,
+                    self.audit_action_helper.build_audit_put(
+                        pk=_room_pk(room_id),
+                        entity_type="Room",
+                        action=AuditActions.CREATE.value,
+                        user_id=owner_id,
+                        sk=self.room_audit_sk,
+                        before=None,
+                        after=room_data,
+                    ),
+                ]
             )
 
-            self.logger.info(f"Created room {room_id} with owner {owner_id}")
-
-            # Create audit record for room
-            self.audit_action_helper.create_audit_record(
-                pk=f"ROOM#{room_id}",
-                entity_type="Room",
-                action=AuditActions.CREATE.value,
-                user_id=owner_id,
-                sk=self.room_audit_sk,
-                before=None,
-                after=room,
-            )
+            self.logger.info("Created room %s with owner %s", room_id, owner_id)
 
             # Return room data with room_id
-            result = room.dict()
-            result["room_id"] = room_id
-            return result
+            return {**room_data, "room_id": room_id}
 
         except ClientError as e:
-            self.logger.error(f"Error creating room for owner {owner_id}: {e}")
+            self.logger.error("Error creating room for owner %s: %s", owner_id, e)
             raise
 
-    def get_room(self, room_id: str) -> dict | None:
+    def get_room(self, room_id: str, use_cache: bool = True) -> dict | None:
         """
         Fetch a room from DynamoDB by room_id.
         Returns a dict with room details or None if not found.
+        Pass use_cache=False for permission and existence checks that come
+        before a write, so a room changed by another container is seen at once.
         """
+        if use_cache:
+            cached = self._cached_room(room_id)
+            if cached:
+                return cached
+
         try:
-            response = self.table.get_item(
-                Key={"PK": f"ROOM#{room_id}", "SK": self.room_sk}
-            )
+            response = self.table.get_item(Key=_room_key(room_id))
 
             if "Item" in response:
-                item = response["Item"]
-                result = {
-                    "room_id": room_id,
-                    "room_name": item.get("room_name"),
-                    "leagues": item.get("leagues"),
-                    "created_at": item.get("created_at"),
-                    "owner_id": item.get("owner_id"),
-                    "public": item.get("public", False),
-                    "description": item.get("description"),
-                    "admins": item.get("admins", []),
-                    "start_date": item.get("start_date"),
-                    "end_date": item.get("end_date"),
-                    "archived": item.get("archived", False),
-                }
-                return result
-            else:
-                self.logger.info(f"No room found for room_id {room_id}")
-                return None
+                room = self._room_from_item(room_id, response["Item"])
+                if _ROOM_CACHE_TTL > 0:
+                    with _ROOM_CACHE_LOCK:
+                        if len(_ROOM_CACHE) >= _ROOM_CACHE_MAX_SIZE:
+                            # Drop the oldest entry
+                            _ROOM_CACHE.pop(next(iter(_ROOM_CACHE)))
+                        _ROOM_CACHE[(self.table.name, room_id)] = (
+                            time.monotonic() + _ROOM_CACHE_TTL,
+                            dict(room),
+                        )
+                return room
+            return None
+
+        except ClientError as e:
+            self.logger.error("Error fetching room %s: %s", room_id, e)
+            raise
 
+    def _get_room_for_auth(self, room_id: str) -> dict | None:
+        """
+        Fetch only the room fields permission checks use: room_name, owner_id
+        and admins. Returns None if the room does not exist. Always read from
+        the table, never the room cache, so a revoked admin is refused at once.
+        """
+        try:
+            response = self.table.get_item(
+                Key=_room_key(room_id),
+                ProjectionExpression="room_name, owner_id, admins",
+            )
         except ClientError as e:
-            self.logger.error(f"Error fetching room {room_id}: {e}")
+            self.logger.error("Error fetching room %s: %s", room_id, e)
             raise
 
+        item = response.get("Item")
+        if item is None:
+            return None
+        return {
+            "room_id": room_id,
+            "room_name": item.get("room_name"),
+            "owner_id": item.get("owner_id"),
+            "admins": item.get("admins", []),
+        }
+
+    def _cached_room(self, room_id: str) -> dict | None:
+        """
+        Return a copy of the cached room, or None if it is missing or expired.
+        """
+        if _ROOM_CACHE_TTL <= 0:
+            return None
+        with _ROOM_CACHE_LOCK:
+            cached = _ROOM_CACHE.get((self.table.name, room_id))
+        if cached and cached[0] > time.monotonic():
+            # Copy so callers can't modify the cached room
+            return dict(cached[1])
+        return None
+
+    @staticmethod
+    def _room_snapshot(room: dict) -> dict:
+        """
+        Copy the room header fields stored on memberships as room_snapshot.
+        """
+        return {field: room.get(field) for field in _ROOM_SNAPSHOT_FIELDS}
+
+    def _invalidate_room(self, room_id: str) -> None:
+        """
+        Drop a room from the get_room cache after it changes.
+        """
+        with _ROOM_CACHE_LOCK:
+            _ROOM_CACHE.pop((self.table.name, room_id), None)
+
+    @staticmethod
+    def _room_from_item(room_id: str, item: dict) -> dict:
+        """
+        Shape a raw room item into the dict returned by get_room.
+        """
+        return {
+            "room_id": room_id,
+            "room_name": item.get("room_name"),
+            "leagues": item.get("leagues"),
+            "created_at": item.get("created_at"),
+            "owner_id": item.get("owner_id"),
+            "public": item.get("public", False),
+            "description": item.get("description"),
+            "admins": item.get("admins", []),
+            "start_date": item.get("start_date"),
+            "end_date": item.get("end_date"),
+            "archived": item.get("archived", False),
+        }
+
+    def _get_rooms_batch(self, room_ids: List[str]) -> Dict[str, dict]:
+        """
+        Fetch several rooms at once with BatchGetItem.
+        Returns a dict of room_id -> room details for the rooms that exist.
+        """
+        keys = [_room_key(room_id) for room_id in dict.fromkeys(room_ids)]
+        chunks = [
+            keys[start : start + _BATCH_GET_SIZE]
+            for start in range(0, len(keys), _BATCH_GET_SIZE)
+        ]
+
+        rooms = {}
+        if len(chunks) > 1:
+            # Each chunk is its own request, so they can be in flight together
+            with ThreadPoolExecutor(
+                max_workers=min(_BATCH_GET_WORKERS, len(chunks))
+            ) as pool:
+                for chunk_rooms in pool.map(self._batch_get_rooms, chunks):
+                    rooms.update(chunk_rooms)
+        elif chunks:
+            rooms = self._batch_get_rooms(chunks[0])
+
+        return rooms
+
+    def _batch_get_rooms(self, keys: List[dict]) -> Dict[str, dict]:
+        """
+        Read up to 100 room keys with BatchGetItem, retrying unprocessed keys
+        with backoff.
+        """
+        # Runs on worker threads, so it uses the thread-safe client
+        client = get_dynamodb_client()
+        table_name = self.table.name
+        request_items = {table_name: {"Keys": [serialize_item(key) for key in keys]}}
+        rooms = {}
+        attempt = 0
+        while request_items:
+            response = client.batch_get_item(RequestItems=request_items)
+            for raw_item in response.get("Responses", {}).get(table_name, []):
+                item = deserialize_item(raw_item)
+                room_id = item["PK"][ROOM_PK_PREFIX_LEN:]
+                rooms[room_id] = self._room_from_item(room_id, item)
+
+            request_items = response.get("UnprocessedKeys") or {}
+            if request_items:
+                attempt += 1
+                if attempt > _BATCH_GET_MAX_RETRIES:
+                    self.logger.warning(
+                        "Giving up on %s unprocessed room keys",
+                        len(request_items[table_name]["Keys"]),
+                    )
+                    break
+                time.sleep(min(0.05 * 2**attempt, 1))
+
+        return rooms
+
     def update_room(
         self,
         room_id: str,
@@ -162,114 +345,151 @@ class RoomHelper:
     ) -> dict:
         """
         Update room fields. Only room admins can update rooms.
+        The admin and date range checks are part of the UpdateItem condition,
+        so the room is not read beforehand.
         """
-        try:
-            # Get the current room
-            room = self.get_room(room_id)
+        # Validate admins list is not empty
+        if admins is not None and not admins:
+            raise EmptyAdminsListException()
+
+        # Both dates supplied: validate here rather than in the condition
+        if start_date is not None and end_date is not None and start_date >= end_date:
+            raise InvalidDateRangeException()
+
+        changes = {
+            "room_name": room_name,
+            "leagues": leagues,
+            "admins": admins,
+            "public": public,
+            "start_date": start_date,
+            "end_date": end_date,
+            "archived": archived,
+        }
+        changes = {k: v for k, v in changes.items() if v is not None}
+        if not changes:
+            # Nothing to write; still enforce the same access rules
+            room = self.get_room(room_id, use_cache=False)
             if not room:
                 raise RoomNotFoundException(room_id=room_id)
-
-            # Check if user is an admin
             if user_id not in room.get("admins", []):
                 raise UnauthorizedRoomAccessException(
                     user_id=user_id, room_id=room_id, action="update"
                 )
-
-            # Build update expression
-            update_expr_parts = []
-            expr_attr_names = {}
-            expr_attr_values = {}
-            current_time = int(datetime.utcnow().timestamp())
-
-            if room_name is not None:
-                update_expr_parts.append("room_name = :room_name")
-                expr_attr_values[":room_name"] = room_name
-
-            if leagues is not None:
-                update_expr_parts.append("leagues = :leagues")
-                expr_attr_values[":leagues"] = leagues
-
-            if admins is not None:
-                # Validate admins list is not empty
-                if not admins:
-                    from exceptions.room_exceptions import EmptyAdminsListException
-
-                    raise EmptyAdminsListException()
-                update_expr_parts.append("admins = :admins")
-                expr_attr_values[":admins"] = admins
-
-            if public is not None:
-                update_expr_parts.append("#public = :public")
-                expr_attr_names["#public"] = "public"  # 'public' is a reserved word
-                expr_attr_values[":public"] = public
-
-            if start_date is not None:
-                update_expr_parts.append("start_date = :start_date")
-                expr_attr_values[":start_date"] = start_date
-
-            if end_date is not None:
-                update_expr_parts.append("end_date = :end_date")
-                expr_attr_values[":end_date"] = end_date
-
-            if archived is not None:
-                update_expr_parts.append("archived = :archived")
-                expr_attr_values[":archived"] = archived
-
-            # Always update modified timestamp
-            update_expr_parts.append("modified_at = :modified_at")
-            expr_attr_values[":modified_at"] = current_time
-
-            # Validate date range if both dates are provided or being updated
-            final_start_date = (
-                start_date if start_date is not None else room.get("start_date")
+            return room
+
+        # Always update modified timestamp
+        changes["modified_at"] = int(time.time())
+
+        # Attribute names go through placeholders since 'public' is a reserved word
+        expr_attr_names = {f"#{k}": k for k in changes}
+        expr_attr_values = {f":{k}": v for k, v in changes.items()}
+        expr_attr_values[":user_id"] = user_id
+        update_expr = "SET " + ", ".join(f"#{k} = :{k}" for k in changes)
+
+        conditions = ["attribute_exists(PK)", "contains(admins, :user_id)"]
+        # Only one date supplied: compare it against the stored one
+        if start_date is not None and end_date is None:
+            expr_attr_names["#end_date"] = "end_date"
+            conditions.append(
+                "(attribute_not_exists(#end_date) OR #end_date > :start_date)"
+            )
+        elif end_date is not None and start_date is None:
+            expr_attr_names["#start_date"] = "start_date"
+            conditions.append(
+                "(attribute_not_exists(#start_date) OR #start_date < :end_date)"
             )
-            final_end_date = end_date if end_date is not None else room.get("end_date")
-
-            if (
-                final_start_date
-                and final_end_date
-                and final_start_date >= final_end_date
-            ):
-                from exceptions.room_exceptions import InvalidDateRangeException
-
-                raise InvalidDateRangeException()
-
-            if not update_expr_parts:
-                # No updates to make
-                return room
-
-            update_expr = "SET " + ", ".join(update_expr_parts)
 
-            # Update the room
+        try:
             response = self.table.update_item(
-                Key={"PK": f"ROOM#{room_id}", "SK": self.room_sk},
+                Key=_room_key(room_id),
                 UpdateExpression=update_expr,
-                ExpressionAttributeNames=expr_attr_names if expr_attr_names else None,
+                ConditionExpression=" AND ".join(conditions),
+                ExpressionAttributeNames=expr_attr_names,
                 ExpressionAttributeValues=expr_attr_values,
-                ReturnValues="ALL_NEW",
+                ReturnValues="ALL_OLD",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
             )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                self.logger.error("Error updating room %s: %s", room_id, e)
+                raise
 
-            updated_room = response["Attributes"]
-            updated_room["room_id"] = room_id
-
-            self.logger.info(f"Updated room {room_id} by user {user_id}")
-
-            # Create audit record
-            self.audit_action_helper.create_audit_record(
-                pk=f"ROOM#{room_id}",
-                entity_type="Room",
-                action=AuditActions.UPDATE.value,
-                user_id=user_id,
-                sk=self.room_audit_sk,
-                before=room,
-                after=updated_room,
-            )
+            # Work out which part of the condition failed from the stored item
+            current = deserialize_item(e.response.get("Item") or {})
+            if not current:
+                raise RoomNotFoundException(room_id=room_id)
+            if user_id not in current.get("admins", []):
+                raise UnauthorizedRoomAccessException(
+                    user_id=user_id, room_id=room_id, action="update"
+                )
+            raise InvalidDateRangeException()
+
+        self._invalidate_room(room_id)
+        room = response["Attributes"]
+        room["room_id"] = room_id
+        updated_room = {**room, **changes}
+
+        self.logger.info("Updated room %s by user %s", room_id, user_id)
+
+        # The update is already applied, so the audit record is written in the background
+        self.audit_action_helper.submit_audit_record(
+            pk=_room_pk(room_id),
+            entity_type="Room",
+            action=AuditActions.UPDATE.value,
+            user_id=user_id,
+            sk=self.room_audit_sk,
+            before=room,
+            after=updated_room,
+        )
+        # Room lists read the snapshot instead of the room, so it is refreshed
+        # before returning rather than left to a worker a frozen container may
+        # never resume
+        self.membership_helper.update_room_snapshots(
+            room_id, self._room_snapshot(updated_room)
+        )
 
-            return updated_room
+        return updated_room
 
-        except ClientError as e:
-            self.logger.error(f"Error updating room {room_id}: {e}")
-            raise
+    def iter_all_rooms(self) -> Iterator[dict]:
+        """
+        Yield every room's basic information (room_id, room_name, description,
+        public, leagues, owner_id, admins) as each scan page arrives, so callers
+        can start on the first rooms before the scan finishes.
+        """
+        scan_kwargs = {
+            "FilterExpression": "begins_with(PK, :pk_prefix) AND SK = :sk",
+            "ExpressionAttributeValues": {
+                ":pk_prefix": ROOM_PK_PREFIX,
+                ":sk": self.room_sk,
+            },
+            "ProjectionExpression": "PK, room_name, description, #public, leagues, owner_id, admins",
+            "ExpressionAttributeNames": {
+                "#public": "public"  # 'public' is a reserved word
+            },
+        }
+
+        while True:
+            response = self.table.scan(**scan_kwargs)
+
+            for item in response.get("Items", []):
+                # Extract room_id from PK
+                pk_value = item.get("PK", "")
+                if pk_value.startswith(ROOM_PK_PREFIX):
+                    yield {
+                        "room_id": pk_value[ROOM_PK_PREFIX_LEN:],
+                        "room_name": item.get("room_name"),
+                        "description": item.get("description"),
+                        "public": item.get("public", False),
+                        "leagues": item.get("leagues", []),
+                        "owner_id": item.get("owner_id"),
+                        "admins": item.get("admins", []),
+                    }
+
+            # Check for more pages
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                break
+            scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
 
     def get_all_rooms(self) -> List[dict]:
         """
@@ -277,57 +497,12 @@ class RoomHelper:
         Returns a list of room summaries.
         """
         try:
-            rooms = []
-            last_evaluated_key = None
-
-            while True:
-                # Scan with filter - more efficient than the previous GSI approach
-                scan_kwargs = {
-                    "FilterExpression": "begins_with(PK, :pk_prefix) AND SK = :sk",
-                    "ExpressionAttributeValues": {
-                        ":pk_prefix": "ROOM#",
-                        ":sk": self.room_sk,
-                    },
-                    "ProjectionExpression": "PK, room_name, description, #public, leagues, owner_id, admins",
-                    "ExpressionAttributeNames": {
-                        "#public": "public"  # 'public' is a reserved word
-                    },
-                }
-
-                # Add pagination key if available
-                if last_evaluated_key:
-                    scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
-
-                response = self.table.scan(**scan_kwargs)
-
-                # Process items
-                for item in response.get("Items", []):
-                    # Extract room_id from PK
-                    pk_value = item.get("PK", "")
-                    if pk_value.startswith("ROOM#"):
-                        room_id = pk_value.replace("ROOM#", "")
-                        rooms.append(
-                            {
-                                "room_id": room_id,
-                                "room_name": item.get("room_name"),
-                                "description": item.get("description"),
-                                "public": item.get("public", False),
-                                "leagues": item.get("leagues", []),
-                                "owner_id": item.get("owner_id"),
-                                "admins": item.get("admins", []),
-                            }
-                        )
-
-                # Check for more pages
-                last_evaluated_key = response.get("LastEvaluatedKey")
-                if not last_evaluated_key:
-                    break
-
-            self.logger.info(f"Retrieved {len(rooms)} rooms")
+            rooms = list(self.iter_all_rooms())
+            self.logger.info("Retrieved %s rooms", len(rooms))
             return rooms
 
         except ClientError as e:
-            self.logger.error(f"Error retrieving all rooms: {e}")
+            self.logger.error("Error retrieving all rooms: %s", e)
             raise
 
     def get_user_rooms(self, user_id: str) -> List[dict]:
@@ -356,45 +531,58 @@ class RoomHelper:
         Get rooms for a user filtered by membership status and optionally by membership type.
         Returns a list of room details with membership information.
         """
+        # Accept both enum and string inputs
+        st_value = getattr(status, "value", status)
+        mt_value = getattr(membership_type, "value", membership_type)
+
         try:
             # Get memberships from MembershipHelper
             memberships = self.membership_helper.get_user_memberships_by_status(
-                user_id, status, membership_type
+                user_id, st_value, mt_value
             )
 
-            user_rooms = []
-            # For each membership, get the room details and combine them
-            for membership in memberships:
-                pk_value = membership.get("PK", "")
-                if pk_value.startswith("ROOM#"):
-                    room_id = pk_value.replace("ROOM#", "")
-                    room_details = self.get_room(room_id)
-                    if room_details:
-                        # Add membership info to room details
-                        room_details["join_date"] = membership.get("join_date")
-                        room_details["is_owner"] = room_details["owner_id"] == user_id
-                        room_details["is_admin"] = user_id in room_details.get(
-                            "admins", []
-                        )
-                        room_details["membership_status"] = membership.get("status")
-                        room_details["membership_type"] = membership.get(
-                            "membership_type"
-                        )
-                        room_details["created_at_membership"] = membership.get(
-                            "created_at"
-                        )
-                        user_rooms.append(room_details)
-
-            status_desc = f"{status.value}" + (
-                f" {membership_type.value}" if membership_type else ""
+            room_memberships = [
+                (membership["PK"][ROOM_PK_PREFIX_LEN:], membership)
+                for membership in memberships
+                if membership.get("PK", "").startswith(ROOM_PK_PREFIX)
+            ]
+            # Memberships written before room_snapshot existed fall back to a
+            # batch read of their rooms
+            rooms = self._get_rooms_batch(
+                [
+                    room_id
+                    for room_id, membership in room_memberships
+                    if not membership.get("room_snapshot")
+                ]
             )
+
+            user_rooms = []
+            for room_id, membership in room_memberships:
+                snapshot = membership.get("room_snapshot")
+                room = (
+                    self._room_from_item(room_id, snapshot)
+                    if snapshot
+                    else rooms.get(room_id)
+                )
+                if room:
+                    # Copy so rooms shared by several memberships stay independent
+                    room_details = dict(room)
+                    room_details["join_date"] = membership.get("join_date")
+                    room_details["is_owner"] = room_details["owner_id"] == user_id
+                    room_details["is_admin"] = user_id in room_details.get("admins", [])
+                    room_details["membership_status"] = membership.get("status")
+                    room_details["membership_type"] = membership.get("membership_type")
+                    room_details["created_at_membership"] = membership.get("created_at")
+                    user_rooms.append(room_details)
+
+            status_desc = st_value + (f" {mt_value}" if mt_value else "")
             self.logger.info(
-                f"Found {len(user_rooms)} {status_desc} rooms for user {user_id}"
+                "Found %s %s rooms for user %s", len(user_rooms), status_desc, user_id
             )
             return user_rooms
 
         except ClientError as e:
-            self.logger.error(f"Error fetching rooms for user {user_id}: {e}")
+            self.logger.error("Error fetching rooms for user %s: %s", user_id, e)
             raise
 
     def delete_room(self, room_id: str, user_id: str) -> bool:
@@ -405,41 +593,53 @@ class RoomHelper:
         """
         try:
             # First, verify the user is the owner
-            room = self.get_room(room_id)
+            room = self.get_room(room_id, use_cache=False)
             if not room:
-                self.logger.warning(f"Room {room_id} not found for deletion")
+                self.logger.warning("Room %s not found for deletion", room_id)
                 return False
 
             if room["owner_id"] != user_id:
                 self.logger.warning(
-                    f"User {user_id} is not the owner of room {room_id}, cannot delete"
+                    "User %s is not the owner of room %s, cannot delete",
+                    user_id,
+                    room_id,
                 )
                 return False
 
-            # Delete the room and all its memberships
-            self.table.delete_item(Key={"PK": f"ROOM#{room_id}", "SK": self.room_sk})
+            # Delete the room together with its audit record first, so a
+            # failed delete leaves the room and its memberships intact
+            get_dynamodb_client().transact_write_items(
+                TransactItems=[
+                    {
+                        "Delete": {
+                            "TableName": self.table.name,
+                            "Key": serialize_item(_room_key(room_id)),
+                        }
+                    },
+                    self.audit_action_helper.build_audit_put(
+                        pk=_room_pk(room_id),
+                        entity_type="Room",
+                        action=AuditActions.DELETE.value,
+                        user_id=user_id,
+                        sk=self.room_audit_sk,
+                        before=room,
+                        after=None,
+                    ),
+                ]
+            )
+            self._invalidate_room(room_id)
 
-            # Use MembershipHelper to delete all memberships
+            # Memberships are unbounded, so they are cleared outside the transaction
             deleted_count = self.membership_helper.delete_all_room_memberships(room_id)
 
-            self.logger.info(f"Deleted room {room_id} and {deleted_count} memberships")
-
-            # Create audit record for room deletion
-            room_model = RoomModel(**room)
-            self.audit_action_helper.create_audit_record(
-                pk=f"ROOM#{room_id}",
-                entity_type="Room",
-                action=AuditActions.DELETE.value,
-                user_id=user_id,
-                sk=self.room_audit_sk,
-                before=room_model,
-                after=None,
+            self.logger.info(
+                "Deleted room %s and %s memberships", room_id, deleted_count
             )
 
             return True
 
         except ClientError as e:
-            self.logger.error(f"Error deleting room {room_id}: {e}")
+            self.logger.error("Error deleting room %s: %s", room_id, e)
             raise
 
     # Membership delegation methods - delegate to MembershipHelper
@@ -451,8 +651,9 @@ class RoomHelper:
         Delegates to MembershipHelper after validating room admin permissions.
         """
         try:
-            # Verify the room exists and user is an admin
-            room = self.get_room(room_id)
+            # Verify the room exists and user is an admin; the full room is
+            # read so the invitation can carry its room_snapshot
+            room = self.get_room(room_id, use_cache=False)
             if not room:
                 raise RoomNotFoundException(room_id=room_id)
 
@@ -462,11 +663,15 @@ class RoomHelper:
                 )
 
             return self.membership_helper.invite_user_to_room(
-                room_id, room["room_name"], admin_id, invited_user_id
+                room_id,
+                room["room_name"],
+                admin_id,
+                invited_user_id,
+                room_snapshot=self._room_snapshot(room),
             )
 
         except ClientError as e:
-            self.logger.error(f"Error creating invitation: {e}")
+            self.logger.error("Error creating invitation: %s", e)
             raise
 
     def request_to_join_room(self, room_id: str, user_id: str) -> dict:
@@ -475,17 +680,21 @@ class RoomHelper:
         Delegates to MembershipHelper after validating room exists.
         """
         try:
-            # Verify the room exists
-            room = self.get_room(room_id)
+            # Verify the room exists; the full room is read so the request
+            # can carry its room_snapshot
+            room = self.get_room(room_id, use_cache=False)
             if not room:
                 raise RoomNotFoundException(room_id=room_id)
 
             return self.membership_helper.request_to_join_room(
-                room_id, room["room_name"], user_id
+                room_id,
+                room["room_name"],
+                user_id,
+                room_snapshot=self._room_snapshot(room),
             )
 
         except ClientError as e:
-            self.logger.error(f"Error creating room request: {e}")
+            self.logger.error("Error creating room request: %s", e)
             raise
 
     def respond_to_membership(
@@ -505,7 +714,7 @@ class RoomHelper:
 
             # For requests, validate that responding user is an admin
             if membership.get("membership_type") == MembershipType.REQUEST.value:
-                room = self.get_room(room_id)
+                room = self._get_room_for_auth(room_id)
                 if not room or responding_user_id not in room["admins"]:
                     raise UnauthorizedRoomAccessException(
                         user_id=responding_user_id,
@@ -518,7 +727,7 @@ class RoomHelper:
             )
 
         except ClientError as e:
-            self.logger.error(f"Error responding to membership: {e}")
+            self.logger.error("Error responding to membership: %s", e)
             raise
 
     def get_pending_invitations(self, user_id: str) -> List[dict]:
@@ -535,7 +744,7 @@ class RoomHelper:
         """
         try:
             # Verify admin permissions
-            room = self.get_room(room_id)
+            room = self._get_room_for_auth(room_id)
             if not room or admin_id not in room["admins"]:
                 raise UnauthorizedRoomAccessException(
                     user_id=admin_id, room_id=room_id, action="view requests for"
@@ -544,5 +753,5 @@ class RoomHelper:
             return self.membership_helper.get_pending_requests_for_room(room_id)
 
         except ClientError as e:
-            self.logger.error(f"Error getting pending requests: {e}")
+            self.logger.error("Error getting pending requests: %s", e)
             raise
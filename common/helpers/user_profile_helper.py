@@ -1,10 +1,36 @@
 from aws_lambda_powertools import Logger
-import boto3
 from botocore.exceptions import ClientError
+from clients.dynamodb_client import (
+    deserialize_item,
+    get_dynamodb_client,
+    get_table,
+    serialize_item,
+)
 from common.models.user_profile import UserProfileModel
-from datetime import datetime
 from common.helpers.audit_actions_helper import AuditActions, AuditActionHelper
+from concurrent.futures import ThreadPoolExecutor
 import os
+import time
+
+# GSI partitioned by SK (sorted by PK) that projects name and color, so every
+# profile can be listed by querying SK = "USER_PROFILE" instead of scanning.
+PROFILE_SK_INDEX = os.getenv("SK_GSI", "SK-index")
+
+_USER_PREFIX = "USER#"
+_USER_PREFIX_LEN = len(_USER_PREFIX)
+
+_BATCH_GET_SIZE = 100
+_BATCH_GET_MAX_RETRIES = 5
+_BATCH_GET_WORKERS = 8
+
+
+def _user_id_from_pk(pk_value: str) -> str:
+    """
+    Strip the USER# prefix from a profile PK, leaving other values untouched.
+    """
+    return (
+        pk_value[_USER_PREFIX_LEN:] if pk_value.startswith(_USER_PREFIX) else pk_value
+    )
 
 
 class UserProfileHelper:
@@ -13,9 +39,10 @@ class UserProfileHelper:
     """
 
     def __init__(self, request_id: str):
-        self.dynamodb = boto3.resource("dynamodb", region_name="us-west-2")
-        table_name = os.getenv("TABLE_NAME")
-        self.table = self.dynamodb.Table(table_name)
+        # Profiles are read and written through the low-level client with the
+        # shared (de)serializers rather than the resource layer
+        self.client = get_dynamodb_client()
+        self.table_name = get_table().name
         self.logger = Logger()
         self.logger.append_keys(request_id=request_id)
         self.sk = "USER_PROFILE"
@@ -31,50 +58,53 @@ class UserProfileHelper:
             user_id=user_id,
             email=email,
             name=name,
-            created_at=int(datetime.utcnow().timestamp()),  # Epoch timestamp
+            created_at=int(time.time()),  # Epoch timestamp
         )
-        item = profile.dict()
-        item["PK"] = f"USER#{user_id}"
-        item["SK"] = self.sk
+        item_data = profile.dict()
+        item = {**item_data, "PK": f"USER#{user_id}", "SK": self.sk}
 
         try:
-            self.table.put_item(Item=item)
-            self.logger.info(f"Created user profile for {user_id}: {item}")
-            self.audit_action_helper.create_audit_record(
-                pk=f"USER#{user_id}",
-                entity_type="UserProfile",
-                action=AuditActions.CREATE.value,
-                user_id=user_id,
-                sk=self.audit_sk,
-                before=None,
-                after=profile,
+            # Write the profile and its audit record atomically
+            self.client.transact_write_items(
+                TransactItems=[
+                    {
+                        "Put": {
+                            "TableName": self.table_name,
+                            "Item": serialize_item(item),
+                        }
+                    },
+                    self.audit_action_helper.build_audit_put(
+                        pk=f"USER#{user_id}",
+                        entity_type="UserProfile",
+                        action=AuditActions.CREATE.value,
+                        user_id=user_id,
+                        sk=self.audit_sk,
+                        before=None,
+                        after=item_data,
+                    ),
+                ]
             )
+            self.logger.info(f"Created user profile for {user_id}: {item}")
         except ClientError as e:
             self.logger.error(f"Error creating user profile for {user_id}: {e}")
             raise
 
     def get_user_profile(self, user_id: str) -> dict | None:
         """
-        Fetch a user profile from DynamoDB by user_id using a query.
+        Fetch a user profile from DynamoDB by user_id.
         Returns a dict with user_id, email, name, created_at, and color.
         """
         try:
-            response = self.table.query(
-                KeyConditionExpression="PK = :pk AND SK = :sk",
-                ExpressionAttributeValues={
-                    ":pk": f"USER#{user_id}",
-                    ":sk": self.sk,
-                },
+            response = self.client.get_item(
+                TableName=self.table_name,
+                Key=serialize_item({"PK": f"USER#{user_id}", "SK": self.sk}),
+                ProjectionExpression="PK, #n, email, created_at, color",
+                ExpressionAttributeNames={"#n": "name"},
             )
-            items = response.get("Items", [])
-            if items:
-                item = items[0]
+            item = deserialize_item(response.get("Item", {}))
+            if item:
                 pk_value = item.get("PK", "")
-                user_id_value = (
-                    pk_value.replace("USER#", "")
-                    if pk_value.startswith("USER#")
-                    else pk_value
-                )
+                user_id_value = _user_id_from_pk(pk_value)
                 result = {
                     "user_id": user_id_value,
                     "email": item.get("email"),
@@ -102,17 +132,28 @@ class UserProfileHelper:
         Update only the provided fields (name, email, color, dark_mode) of the user profile.
         Only fields that are not None will be updated.
         """
-        # Use locals() to build updated_changes dict
         updated_changes = {
             key: value
-            for key, value in locals().items()
-            if key not in ("self", "user_id") and value is not None
+            for key, value in (
+                ("name", name),
+                ("email", email),
+                ("color", color),
+                ("dark_mode", dark_mode),
+            )
+            if value is not None
         }
 
         if not updated_changes:
             self.logger.info(f"No fields to update for user {user_id}")
             return None
 
+        # Stored profiles are loaded without validation below, so check the
+        # incoming color before it is written
+        if "color" in updated_changes:
+            updated_changes["color"] = UserProfileModel.validate_color(
+                updated_changes["color"]
+            )
+
         update_expr = []
         expr_attr_names = {}
         expr_attr_values = {}
@@ -127,54 +168,56 @@ class UserProfileHelper:
         update_expression = "SET " + ", ".join(update_expr)
 
         try:
-            # Fetch current profile for audit
-            before_item = self.table.get_item(
-                Key={"PK": f"USER#{user_id}", "SK": self.sk}
-            ).get("Item")
-            before = UserProfileModel(**before_item) if before_item else None
-
-            response = self.table.update_item(
-                Key={"PK": f"USER#{user_id}", "SK": self.sk},
+            # ALL_OLD returns the before-image for the audit, so the profile
+            # is not read separately; the condition keeps a missing profile
+            # from being created as a partial item
+            response = self.client.update_item(
+                TableName=self.table_name,
+                Key=serialize_item({"PK": f"USER#{user_id}", "SK": self.sk}),
                 UpdateExpression=update_expression,
+                ConditionExpression="attribute_exists(PK)",
                 ExpressionAttributeNames=expr_attr_names,
-                ExpressionAttributeValues=expr_attr_values,
-                ReturnValues="ALL_NEW",
+                ExpressionAttributeValues=serialize_item(expr_attr_values),
+                ReturnValues="ALL_OLD",
             )
-            self.logger.info(
-                f"Updated user profile fields for {user_id}: {response.get('Attributes')}"
-            )
-            if "Attributes" in response:
-                attrs = response["Attributes"]
-                after = UserProfileModel(**attrs)
-                # Audit: before and after as UserProfileModel
-                self.audit_action_helper.create_audit_record(
-                    pk=f"USER#{user_id}",
-                    entity_type="UserProfile",
-                    user_id=user_id,
-                    sk=self.audit_sk,
-                    action=AuditActions.UPDATE.value,
-                    before=before,
-                    after=after,
-                )
-                return after
-            else:
-                return None
         except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                self.logger.info(f"No user profile found for {user_id}.")
+                return None
             self.logger.error(f"Error updating user profile fields for {user_id}: {e}")
             raise
 
+        old_attrs = deserialize_item(response.get("Attributes", {}))
+        before = UserProfileModel.from_dynamo(old_attrs)
+        after = UserProfileModel.from_dynamo({**old_attrs, **updated_changes})
+        self.logger.info(f"Updated user profile fields for {user_id}: {after}")
+
+        # Audit: before and after as UserProfileModel. The before-image only
+        # exists once the update has returned, so the audit cannot join it in
+        # a transaction; it is written before returning instead
+        self.audit_action_helper.create_audit_record(
+            pk=f"USER#{user_id}",
+            entity_type="UserProfile",
+            user_id=user_id,
+            sk=self.audit_sk,
+            action=AuditActions.UPDATE.value,
+            before=before,
+            after=after,
+        )
+        return after
+
     def get_all_profiles(self):
         """
         Return all user profiles from the database.
         """
         try:
-            table_name = self.table.name
-            client = boto3.client("dynamodb", region_name="us-west-2")
-            paginator = client.get_paginator("scan")
+            table_name = self.table_name
+            paginator = self.client.get_paginator("query")
             all_profiles = []
             for page in paginator.paginate(
                 TableName=table_name,
-                FilterExpression="SK = :sk",
+                IndexName=PROFILE_SK_INDEX,
+                KeyConditionExpression="SK = :sk",
                 ExpressionAttributeValues={
                     ":sk": {"S": self.sk},
                 },
@@ -182,11 +225,11 @@ class UserProfileHelper:
                 ExpressionAttributeNames={"#n": "name"},
             ):
                 items = page.get("Items", [])
-                self.logger.info(f"Fetched {len(items)} items from DynamoDB scan")
+                self.logger.info(f"Fetched {len(items)} items from {PROFILE_SK_INDEX}")
                 for item in items:
                     self.logger.info(f"Processing item: {item}")
                     profile = {
-                        "user_id": item["PK"]["S"].replace("USER#", ""),
+                        "user_id": _user_id_from_pk(item["PK"]["S"]),
                         "name": item.get("name", {}).get("S"),
                         "color": item.get("color", {}).get("S", "black"),
                     }
@@ -205,36 +248,35 @@ class UserProfileHelper:
         if not user_ids:
             return {}
 
+        # BatchGetItem rejects duplicate keys and takes at most 100 per call
+        unique_ids = list(dict.fromkeys(user_ids))
+        chunks = [
+            unique_ids[start : start + _BATCH_GET_SIZE]
+            for start in range(0, len(unique_ids), _BATCH_GET_SIZE)
+        ]
+
         profiles = {}
         try:
-            # Use batch_get_item for better performance with proper DynamoDB format
-            request_items = {
-                self.table.name: {
-                    "Keys": [
-                        {"PK": {"S": f"USER#{user_id}"}, "SK": {"S": self.sk}}
-                        for user_id in user_ids
-                    ],
-                    "ProjectionExpression": "PK,#n,color",
-                    "ExpressionAttributeNames": {"#n": "name"},
-                }
-            }
-
-            client = boto3.client("dynamodb", region_name="us-west-2")
-            response = client.batch_get_item(RequestItems=request_items)
-
-            items = response.get("Responses", {}).get(self.table.name, [])
+            if len(chunks) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(_BATCH_GET_WORKERS, len(chunks))
+                ) as pool:
+                    chunk_items = list(pool.map(self._batch_get_profiles, chunks))
+            else:
+                chunk_items = [self._batch_get_profiles(chunks[0])]
 
-            for item in items:
-                user_id = item["PK"]["S"].replace("USER#", "")
-                name = item.get("name", {}).get(
-                    "S", user_id
-                )  # fallback to user_id if no name
-                color = item.get("color", {}).get("S", "black")
+            for items in chunk_items:
+                for item in items:
+                    user_id = _user_id_from_pk(item["PK"]["S"])
+                    name = item.get("name", {}).get(
+                        "S", user_id
+                    )  # fallback to user_id if no name
+                    color = item.get("color", {}).get("S", "black")
 
-                profiles[user_id] = {"name": name, "color": color}
+                    profiles[user_id] = {"name": name, "color": color}
 
             # For user_ids that weren't found, create fallback entries
-            for user_id in user_ids:
+            for user_id in unique_ids:
                 if user_id not in profiles:
                     profiles[user_id] = {
                         "name": user_id,  # fallback to user_id as name
@@ -250,3 +292,38 @@ class UserProfileHelper:
             return {
                 user_id: {"name": user_id, "color": "black"} for user_id in user_ids
             }
+
+    def _batch_get_profiles(self, user_ids: list) -> list:
+        """
+        Read the name and color of up to 100 profiles with BatchGetItem,
+        retrying unprocessed keys with backoff. Returns the raw items.
+        """
+        table_name = self.table_name
+        request_items = {
+            table_name: {
+                "Keys": [
+                    {"PK": {"S": f"USER#{user_id}"}, "SK": {"S": self.sk}}
+                    for user_id in user_ids
+                ],
+                "ProjectionExpression": "PK,#n,color",
+                "ExpressionAttributeNames": {"#n": "name"},
+            }
+        }
+
+        items = []
+        attempt = 0
+        while request_items:
+            response = self.client.batch_get_item(RequestItems=request_items)
+            items.extend(response.get("Responses", {}).get(table_name, []))
+
+            request_items = response.get("UnprocessedKeys") or {}
+            if request_items:
+                attempt += 1
+                if attempt > _BATCH_GET_MAX_RETRIES:
+                    self.logger.warning(
+                        f"Giving up on {len(request_items[table_name]['Keys'])} unprocessed profile keys"
+                    )
+                    break
+                time.sleep(min(0.05 * 2**attempt, 1))
+
+        return items
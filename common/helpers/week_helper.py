@@ -1,10 +1,32 @@
 from aws_lambda_powertools import Logger
-from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from common.helpers.nfl_helper import NFLHelper
 from clients.espn_client import ESPNClient
 from datetime import datetime, timezone
 from dateutil.parser import isoparse
+import threading
+import time
+
+_SECONDS_PER_DAY = 86400
+
+# ESPN's season calendar changes at most weekly, so it is kept per year for an
+# hour rather than fetched on every get_nfl_current_week call
+_CALENDAR_TTL_SECONDS = 3600
+_CALENDAR_CACHE: Dict[int, Tuple[float, List[dict]]] = {}
+_CALENDAR_LOCK = threading.Lock()
+
+
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ESPN ISO-8601 timestamp such as "2024-09-05T07:00Z". The C
+    fromisoformat handles these once the "Z" is spelled as an offset; anything
+    it rejects falls back to dateutil.
+    """
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return isoparse(value)
 
 
 class WeekHelper:
@@ -16,6 +38,7 @@ class WeekHelper:
         self.logger = Logger()
         self.logger.append_keys(request_id=request_id)
         self.request_id = request_id
+        self.nfl_helper = NFLHelper(request_id=request_id)
 
     def get_week_boundary(
         self, sport: str, league: str, event_datetime: int, game_id: str = None
@@ -91,10 +114,8 @@ class WeekHelper:
             event_dt = datetime.fromtimestamp(event_datetime)
             year = event_dt.year
 
-            # Use NFLHelper to find the week boundary - pass request_id
-            request_id = getattr(self.logger, "_keys", {}).get("request_id")
-            nfl_helper = NFLHelper(request_id=request_id)
-            week_boundary = nfl_helper.get_week_boundary_by_game_id(game_id, year)
+            # NFLHelper memoizes boundaries per (game_id, year) for the container
+            week_boundary = self.nfl_helper.get_week_boundary_by_game_id(game_id, year)
 
             if week_boundary:
                 self.logger.info(
@@ -113,7 +134,7 @@ class WeekHelper:
 
     def _get_calendar_week_boundary(self, event_datetime: int) -> Tuple[int, int]:
         """
-        Get calendar week boundaries (Sunday to Saturday).
+        Get calendar week boundaries (Sunday to Saturday, UTC).
 
         Args:
             event_datetime: Event timestamp in epoch seconds
@@ -122,22 +143,14 @@ class WeekHelper:
             tuple: (week_start_epoch, week_end_epoch)
         """
         try:
-            # Convert to datetime
-            event_dt = datetime.fromtimestamp(event_datetime)
+            # 1970-01-01 was a Thursday, so days since the epoch + 4 is the
+            # day of the week counted from Sunday (0) to Saturday (6)
+            day_start = event_datetime - event_datetime % _SECONDS_PER_DAY
+            days_since_sunday = (event_datetime // _SECONDS_PER_DAY + 4) % 7
 
-            # Find the Sunday of the week (start of week)
-            days_since_sunday = event_dt.weekday() + 1  # Monday=0, so Sunday=6, adjust
-            if days_since_sunday == 7:  # If it's Sunday
-                days_since_sunday = 0
-
-            week_start = event_dt - timedelta(days=days_since_sunday)
-            week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-
-            # End of week is Saturday
-            week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-            week_start_epoch = int(week_start.timestamp())
-            week_end_epoch = int(week_end.timestamp())
+            # Week runs from Sunday 00:00:00 to Saturday 23:59:59 (UTC)
+            week_start_epoch = day_start - days_since_sunday * _SECONDS_PER_DAY
+            week_end_epoch = week_start_epoch + 7 * _SECONDS_PER_DAY - 1
 
             self.logger.info(
                 f"Calendar week boundary: {week_start_epoch} to {week_end_epoch}"
@@ -150,12 +163,25 @@ class WeekHelper:
             # Fallback: use event_datetime as both start and end
             return event_datetime, event_datetime
 
-    def get_nfl_current_week(self):
-        espn_client = ESPNClient(request_id=self.request_id)
+    def _get_nfl_calendar(self, year: int) -> List[dict]:
+        """
+        Return ESPN's NFL season calendar for a year, cached for an hour.
+        """
+        with _CALENDAR_LOCK:
+            cached = _CALENDAR_CACHE.get(year)
+            if cached and time.monotonic() - cached[0] < _CALENDAR_TTL_SECONDS:
+                return cached[1]
+
+            # Fetch under the lock so concurrent cold misses share one request
+            espn_client = ESPNClient(request_id=self.request_id)
+            full_schedule = espn_client.get_nfl_schedule(year)
+            calendar = full_schedule["leagues"][0]["calendar"]
+            _CALENDAR_CACHE[year] = (time.monotonic(), calendar)
+            return calendar
 
+    def get_nfl_current_week(self):
         now = datetime.now(timezone.utc)
-        full_schedule = espn_client.get_nfl_schedule(now.year)
-        schedule = full_schedule["leagues"][0]["calendar"]
+        schedule = self._get_nfl_calendar(now.year)
 
         current_week_info = {
             "season_type_label": None,
@@ -168,10 +194,13 @@ class WeekHelper:
 
         for season in schedule:
             for week in season.get("entries", []):
-                start = isoparse(week["startDate"])
-                end = isoparse(week["endDate"])
-                if start <= now <= end:
-                    current_week_info = {
+                # Weeks don't overlap, so stop at the first one containing now;
+                # the start date is only parsed for weeks that have not ended
+                if (
+                    now <= _parse_iso(week["endDate"])
+                    and _parse_iso(week["startDate"]) <= now
+                ):
+                    return {
                         "season_type_label": season["label"],
                         "season_type_value": season["value"],
                         "week_label": week["label"],
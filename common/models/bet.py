@@ -1,7 +1,6 @@
 from pydantic import BaseModel, EmailStr, validator
 from datetime import datetime
 from typing import Optional, Literal, Dict, Any
-from boto3.dynamodb.types import TypeDeserializer
 import random
 
 
@@ -30,6 +29,11 @@ class GameBet(BaseModel):
     result: Optional[Literal["win", "loss", "push"]] = None
     points_earned: Optional[int] = None
 
+    class Config:
+        # BetModel embeds an already-validated GameBet; reuse it instead of
+        # copying it on every BetModel construction
+        copy_on_model_validation = "none"
+
     @validator("points_wagered")
     def validate_points_wagered(cls, v):
         if v not in [1, 2, 3]:
@@ -1,7 +1,6 @@
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, EmailStr, root_validator
 from datetime import datetime
 from typing import Optional
-from boto3.dynamodb.types import TypeDeserializer
 from enum import Enum
 
 
@@ -32,17 +31,16 @@ class MembershipModel(BaseModel):
     join_date: Optional[int] = None  # Epoch timestamp, set when approved
     created_at: int  # Epoch timestamp, when request/invitation was created
 
-    @validator("invited_user")
-    def validate_invitation_fields(cls, v, values):
-        membership_type = values.get("membership_type")
-        if membership_type == MembershipType.INVITATION and not v:
-            raise ValueError("invited_user is required for invitations")
-        if (
-            membership_type
-            in [MembershipType.REQUEST, MembershipType.ADMIN, MembershipType.MEMBER]
-            and v
-        ):
+    @root_validator(skip_on_failure=True)
+    def validate_invitation_fields(cls, values):
+        # invited_user is declared before membership_type, so a field validator
+        # on it would never see the type; check both once the model is built
+        invited_user = values.get("invited_user")
+        if values.get("membership_type") is MembershipType.INVITATION:
+            if not invited_user:
+                raise ValueError("invited_user is required for invitations")
+        elif invited_user:
             raise ValueError(
                 "invited_user should not be set for requests, admin, or member memberships"
             )
-        return v
+        return values
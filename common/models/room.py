@@ -1,7 +1,6 @@
 from pydantic import BaseModel, EmailStr, validator
 from datetime import datetime
 from typing import Optional
-from boto3.dynamodb.types import TypeDeserializer
 from exceptions.room_exceptions import (
     InvalidLeagueException,
     EmptyLeagueListException,
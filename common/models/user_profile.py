@@ -1,50 +1,74 @@
-from pydantic import BaseModel, EmailStr, validator
-from typing import Optional
-from boto3.dynamodb.types import TypeDeserializer
+from pydantic import BaseModel, validator
+from exceptions.user_exceptions import UserNameTooLong
+import re
+
+_ALLOWED_COLORS = frozenset(
+    (
+        "black",
+        "white",
+        "red",
+        "blue",
+        "green",
+        "yellow",
+        "orange",
+        "purple",
+        "pink",
+        "brown",
+        "gray",
+        "cyan",
+    )
+)
+# Maps the common spellings of each color straight to its canonical lowercase
+# form, so stored and typical input skips str.lower()
+_COLOR_CANON = {
+    variant: color
+    for color in _ALLOWED_COLORS
+    for variant in (color, color.upper(), color.title())
+}
+_ALLOWED_COLORS_MSG = "Color must be one of: " + ", ".join(sorted(_ALLOWED_COLORS))
+
+# A syntax check only; addresses come from Cognito, which has already verified them
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class UserProfileModel(BaseModel):
     # pk USER#{user_uuid}
     # sk USER_PROFILE
     user_id: str
-    email: EmailStr
+    email: str
     name: str
     created_at: int  # Epoch timestamp
     color: str = "black"  # Default color for user profile avatar
     dark_mode: bool = False  # Default dark mode preference
 
+    @validator("email")
+    def validate_email(cls, v):
+        """Validate that email looks like an address"""
+        if not _EMAIL_RE.match(v):
+            raise ValueError("Invalid email address")
+        return v
+
     @validator("color")
     def validate_color(cls, v):
         """Validate that color is one of the allowed basic colors"""
-        allowed_colors = [
-            "black",
-            "white",
-            "red",
-            "blue",
-            "green",
-            "yellow",
-            "orange",
-            "purple",
-            "pink",
-            "brown",
-            "gray",
-            "cyan",
-        ]
-        if v.lower() not in allowed_colors:
-            raise ValueError(f'Color must be one of: {", ".join(allowed_colors)}')
-        return v.lower()
+        canon = _COLOR_CANON.get(v)
+        if canon is None:
+            canon = v.lower()
+            if canon not in _ALLOWED_COLORS:
+                raise ValueError(_ALLOWED_COLORS_MSG)
+        return canon
 
     @validator("name")
     def validate_name(cls, v):
         """Validate that name is not empty and is at most 25 characters"""
-        import logging
-
-        logging.basicConfig(level=logging.INFO)
-        logging.info(f"Validating name: '{v}' (type: {type(v)})")
-        if not v or len(v) > 25:
-            logging.warning(
-                f"Name validation failed: '{v}' (length: {len(v) if v else 0})"
-            )
+        if not 0 < len(v) <= 25:
             raise UserNameTooLong(25)
-        logging.info(f"Name validation passed: '{v}' (length: {len(v)})")
         return v.strip()
+
+    @classmethod
+    def from_dynamo(cls, item: dict) -> "UserProfileModel":
+        """
+        Build a profile from a stored DynamoDB item without re-running
+        validation; the item was validated when it was written.
+        """
+        return cls.construct(**{k: v for k, v in item.items() if k in cls.__fields__})
@@ -18,9 +18,10 @@ class DuplicateBetException(BetException):
         self.room_id = room_id
         self.user_id = user_id
         self.points_wagered = points_wagered
-        super().__init__(
-            f"User {user_id} already has a {points_wagered}-point bet in room {room_id}"
-        )
+        super().__init__(room_id, user_id, points_wagered)
+
+    def __str__(self):
+        return f"User {self.user_id} already has a {self.points_wagered}-point bet in room {self.room_id}"
 
 
 class BetNotFound(BetException):
@@ -30,9 +31,10 @@ class BetNotFound(BetException):
         self.room_id = room_id
         self.user_id = user_id
         self.points_wagered = points_wagered
-        super().__init__(
-            f"No {points_wagered}-point bet found for user {user_id} in room {room_id}"
-        )
+        super().__init__(room_id, user_id, points_wagered)
+
+    def __str__(self):
+        return f"No {self.points_wagered}-point bet found for user {self.user_id} in room {self.room_id}"
 
 
 class InvalidGameStatusException(BetException):
@@ -41,9 +43,10 @@ class InvalidGameStatusException(BetException):
     def __init__(self, current_status: str, required_status: str = "STATUS_SCHEDULED"):
         self.current_status = current_status
         self.required_status = required_status
-        super().__init__(
-            f"Cannot update bet: game status is {current_status}, must be {required_status}"
-        )
+        super().__init__(current_status, required_status)
+
+    def __str__(self):
+        return f"Cannot update bet: game status is {self.current_status}, must be {self.required_status}"
 
 
 class InvalidPointsWageredException(BetException):
@@ -51,9 +54,10 @@ class InvalidPointsWageredException(BetException):
 
     def __init__(self, points_wagered: int):
         self.points_wagered = points_wagered
-        super().__init__(
-            f"Invalid points wagered: {points_wagered}. Must be 1, 2, or 3"
-        )
+        super().__init__(points_wagered)
+
+    def __str__(self):
+        return f"Invalid points wagered: {self.points_wagered}. Must be 1, 2, or 3"
 
 
 class BetLockedException(BetException):
@@ -63,9 +67,10 @@ class BetLockedException(BetException):
         self.room_id = room_id
         self.user_id = user_id
         self.points_wagered = points_wagered
-        super().__init__(
-            f"Cannot modify locked {points_wagered}-point bet for user {user_id} in room {room_id}"
-        )
+        super().__init__(room_id, user_id, points_wagered)
+
+    def __str__(self):
+        return f"Cannot modify locked {self.points_wagered}-point bet for user {self.user_id} in room {self.room_id}"
 
 
 class InvalidBetTypeException(BetException):
@@ -74,12 +79,12 @@ class InvalidBetTypeException(BetException):
     def __init__(self, bet_type: str, missing_field: str = None):
         self.bet_type = bet_type
         self.missing_field = missing_field
-        if missing_field:
-            super().__init__(
-                f"Invalid {bet_type} bet: missing required field '{missing_field}'"
-            )
-        else:
-            super().__init__(f"Invalid bet type: {bet_type}")
+        super().__init__(bet_type, missing_field)
+
+    def __str__(self):
+        if self.missing_field:
+            return f"Invalid {self.bet_type} bet: missing required field '{self.missing_field}'"
+        return f"Invalid bet type: {self.bet_type}"
 
 
 class UserProfileNotFoundException(BetException):
@@ -87,7 +92,10 @@ class UserProfileNotFoundException(BetException):
 
     def __init__(self, user_id: str):
         self.user_id = user_id
-        super().__init__(f"User profile not found for user {user_id}")
+        super().__init__(user_id)
+
+    def __str__(self):
+        return f"User profile not found for user {self.user_id}"
 
 
 class GameDataNotFoundException(BetException):
@@ -97,12 +105,12 @@ class GameDataNotFoundException(BetException):
         self.game_id = game_id
         self.sport = sport
         self.league = league
-        if sport and league:
-            super().__init__(
-                f"Unable to retrieve game data for {sport}/{league} game {game_id}"
-            )
-        else:
-            super().__init__(f"Unable to retrieve game data for game {game_id}")
+        super().__init__(game_id, sport, league)
+
+    def __str__(self):
+        if self.sport and self.league:
+            return f"Unable to retrieve game data for {self.sport}/{self.league} game {self.game_id}"
+        return f"Unable to retrieve game data for game {self.game_id}"
 
 
 class DuplicateGameException(BetException):
@@ -110,4 +118,7 @@ class DuplicateGameException(BetException):
 
     def __init__(self, game_id: str):
         self.game_id = game_id
-        super().__init__(f"A bet already exists for game {game_id}")
+        super().__init__(game_id)
+
+    def __str__(self):
+        return f"A bet already exists for game {self.game_id}"
@@ -0,0 +1,30 @@
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+from common.helpers.audit_actions_helper import drain_audit_records
+from common.helpers.bet_helper import drain_status_writes
+
+
+def _drain_background_writes():
+    drain_status_writes()
+    drain_audit_records()
+
+
+class BackgroundWritesMiddleware:
+    """
+    Wait for the DynamoDB writes helpers hand to background workers before the
+    request completes. Mangum returns the response to Lambda only once the app
+    finishes, so nothing is left pending when the container is frozen.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await run_in_threadpool(_drain_background_writes)
@@ -1,7 +1,9 @@
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import RedirectResponse, Response
 from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Optional
 from urllib.parse import urlencode, urlparse, parse_qs
+import functools
 import os
 import httpx
 from aws_lambda_powertools import Logger
@@ -11,72 +13,136 @@ COGNITO_DOMAIN = os.getenv("COGNITO_DOMAIN", "")
 COGNITO_CLIENT_ID = os.getenv("COGNITO_CLIENT_ID", "")
 # Update redirect URI to port 5000
 COGNITO_API_REDIRECT_URI = os.getenv("COGNITO_API_REDIRECT_URI")
-COGNITO_AUTH_URL = f"{COGNITO_DOMAIN}/login?" + urlencode(
-    {
-        "client_id": COGNITO_CLIENT_ID,
-        "response_type": "code",  # Use code flow
-        "scope": "openid email profile",
-        "redirect_uri": COGNITO_API_REDIRECT_URI,
-    }
-)
 
 logger = Logger(service=API_SERVICE)
 
+# Only the docs page and the root (Cognito's redirect target) are handled here
+_AUTH_PATHS = frozenset(("/docs", "/"))
 
-class CognitoAuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        logger.debug(f"Processing authentication request: {request.url.path}")
+# Shared so the pooled TLS connection to Cognito survives between token
+# exchanges; created on first use so it binds to the running event loop
+_cognito_client = None
+
+
+def _get_cognito_client() -> httpx.AsyncClient:
+    global _cognito_client
+    if _cognito_client is None:
+        _cognito_client = httpx.AsyncClient(
+            base_url=COGNITO_DOMAIN,
+            timeout=httpx.Timeout(5.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+    return _cognito_client
+
+
+@functools.lru_cache(maxsize=1)
+def _cognito_auth_url() -> str:
+    """
+    Build the Cognito hosted-login URL on the first redirect, from the same
+    settings the token exchange uses, and reuse it afterwards.
+    """
+    return f"{COGNITO_DOMAIN}/login?" + urlencode(
+        {
+            "client_id": COGNITO_CLIENT_ID,
+            "response_type": "code",  # Use code flow
+            "scope": "openid email profile",
+            "redirect_uri": COGNITO_API_REDIRECT_URI or "",
+        }
+    )
+
+
+async def close_cognito_client():
+    """Close the shared Cognito HTTP client, if one was opened."""
+    global _cognito_client
+    if _cognito_client is not None:
+        await _cognito_client.aclose()
+        _cognito_client = None
+
+
+class CognitoAuthMiddleware:
+    """
+    Pure ASGI middleware; avoids the per-request task group and body streams
+    that BaseHTTPMiddleware sets up around call_next.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        logger.debug("Processing authentication request: %s", path)
         # Only apply to /docs and root (for redirect)
-        if request.url.path in ["/docs", "/"]:
-            id_token = request.cookies.get("id_token")
-            code = request.query_params.get("code")
-            logger.debug(
-                f"Authentication tokens - id_token: {bool(id_token)}, code: {bool(code)}"
+        if path in _AUTH_PATHS:
+            response = await self._authenticate(Request(scope, receive), path)
+            if response is not None:
+                await response(scope, receive, send)
+                return
+
+        status_code = "unknown"
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        logger.debug("Request processed: %s -> %s", path, status_code)
+
+    async def _authenticate(self, request: Request, path: str) -> Optional[Response]:
+        """
+        Return the redirect for a /docs or root request that needs one, or None
+        to pass the request on.
+        """
+        id_token = request.cookies.get("id_token")
+        code = request.query_params.get("code")
+        logger.debug(
+            "Authentication tokens - id_token: %s, code: %s",
+            bool(id_token),
+            bool(code),
+        )
+        if not id_token and code:
+            logger.info("Attempting token exchange with authorization code")
+            # Exchange code for tokens
+            token_resp = await _get_cognito_client().post(
+                "/oauth2/token",
+                data={
+                    "grant_type": "authorization_code",
+                    "client_id": COGNITO_CLIENT_ID,
+                    "code": code,
+                    "redirect_uri": COGNITO_API_REDIRECT_URI,
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
             )
-            if not id_token and code:
-                logger.info("Attempting token exchange with authorization code")
-                # Exchange code for tokens
-                async with httpx.AsyncClient() as client:
-                    token_resp = await client.post(
-                        f"{COGNITO_DOMAIN}/oauth2/token",
-                        data={
-                            "grant_type": "authorization_code",
-                            "client_id": COGNITO_CLIENT_ID,
-                            "code": code,
-                            "redirect_uri": COGNITO_API_REDIRECT_URI,
-                        },
-                        headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    )
-                logger.debug(
-                    f"Token exchange response status: {token_resp.status_code}"
-                )
-                if token_resp.status_code == 200:
-                    tokens = token_resp.json()
-                    id_token = tokens.get("id_token")
-                    logger.info(
-                        f"Token exchange successful, id_token received: {bool(id_token)}"
-                    )
-                    if id_token:
-                        response = RedirectResponse(url="/docs")
-                        response.set_cookie("id_token", id_token, httponly=True)
-                        return response
-                else:
-                    logger.error(
-                        f"Token exchange failed with status {token_resp.status_code}: {token_resp.text}"
-                    )
-                # If token exchange fails, redirect to Cognito login
+            logger.debug("Token exchange response status: %s", token_resp.status_code)
+            if token_resp.status_code == 200:
+                tokens = token_resp.json()
+                id_token = tokens.get("id_token")
                 logger.info(
-                    "Redirecting to Cognito login due to token exchange failure"
+                    "Token exchange successful, id_token received: %s",
+                    bool(id_token),
                 )
-                return RedirectResponse(COGNITO_AUTH_URL)
-            # This block is likely NOT being executed because another middleware (JWTMiddleware) is returning 401 first
-            if request.url.path == "/docs" and not id_token:
-                logger.info(
-                    "No id_token found for /docs endpoint, redirecting to Cognito login"
+                if id_token:
+                    response = RedirectResponse(url="/docs")
+                    response.set_cookie("id_token", id_token, httponly=True)
+                    return response
+            else:
+                logger.error(
+                    "Token exchange failed with status %s: %s",
+                    token_resp.status_code,
+                    token_resp.text,
                 )
-                return RedirectResponse(COGNITO_AUTH_URL)
-        response = await call_next(request)
-        logger.debug(
-            f"Request processed: {request.url.path} -> {getattr(response, 'status_code', 'unknown')}"
-        )
-        return response
+            # If token exchange fails, redirect to Cognito login
+            logger.info("Redirecting to Cognito login due to token exchange failure")
+            return RedirectResponse(_cognito_auth_url())
+        # This block is likely NOT being executed because another middleware (JWTMiddleware) is returning 401 first
+        if path == "/docs" and not id_token:
+            logger.info(
+                "No id_token found for /docs endpoint, redirecting to Cognito login"
+            )
+            return RedirectResponse(_cognito_auth_url())
+        return None
@@ -1,4 +1,4 @@
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.metrics import Metrics, MetricUnit
 import gc
@@ -13,61 +13,100 @@ from common.constants.metrics import (
 )
 
 logger = Logger(service=API_SERVICE)
+metrics = Metrics(namespace=API_METRICS_NAMESPACE, service=API_SERVICE)
 
+# The per-request memory metrics are a diagnostic; they are only emitted when
+# ENABLE_MEMORY_METRICS=1
+_MEMORY_METRICS_ENABLED = os.getenv("ENABLE_MEMORY_METRICS") == "1"
 
-class MemoryCleanupMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        # Attach request_id if available
-        if hasattr(request.state, "request_id") and request.state.request_id:
-            logger.append_keys(request_id=request.state.request_id)
+# tracemalloc instruments every allocation while it is tracing, so per-request
+# snapshots are only taken when MEMORY_PROFILE=1
+_MEMORY_PROFILE = os.getenv("MEMORY_PROFILE") == "1"
 
-        # Get endpoint name for metrics
-        endpoint = request.url.path
+# A full collection walks every live object; run one every N requests rather
+# than after each one
+_GC_EVERY_N_REQUESTS = max(int(os.getenv("GC_EVERY_N_REQUESTS", "100")), 1)
+_request_count = 0
 
-        # Get stage for metrics namespace
-        metrics = Metrics(
-            namespace=API_METRICS_NAMESPACE,
-            service=API_SERVICE,
-        )
-        metrics.add_dimension(name=ENDPOINT, value=endpoint)
+# Snapshots leave out tracemalloc's own bookkeeping and import machinery so the
+# diff only covers what the request allocated
+_TRACEMALLOC_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+class MemoryCleanupMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        global _request_count
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Attach request_id if available
+        request_id = scope.get("state", {}).get("request_id")
+        if request_id:
+            logger.append_keys(request_id=request_id)
+
+        if not _MEMORY_PROFILE:
+            await self.app(scope, receive, send)
+            _request_count += 1
+            if _request_count % _GC_EVERY_N_REQUESTS == 0:
+                gc.collect()
+            return
 
         tracemalloc.start()
-        snapshot_before = tracemalloc.take_snapshot()
+        snapshot_before = tracemalloc.take_snapshot().filter_traces(
+            _TRACEMALLOC_FILTERS
+        )
 
-        response = await call_next(request)
+        await self.app(scope, receive, send)
 
-        gc.collect()  # Run garbage collection after every request
+        gc.collect()  # Profiling runs collect after every request
 
         # Only take snapshot if tracemalloc is still tracing
         if tracemalloc.is_tracing():
-            snapshot_after = tracemalloc.take_snapshot()
-            stats = snapshot_after.compare_to(snapshot_before, "filename")
-            total_before = (
-                sum([stat.size_diff for stat in stats if stat.size_diff < 0]) * -1
+            snapshot_after = tracemalloc.take_snapshot().filter_traces(
+                _TRACEMALLOC_FILTERS
             )
-            total_after = sum([stat.size_diff for stat in stats if stat.size_diff > 0])
+            stats = snapshot_after.compare_to(snapshot_before, "filename")
+            total_before = 0
+            total_after = 0
+            for stat in stats:
+                size_diff = stat.size_diff
+                if size_diff < 0:
+                    total_before -= size_diff
+                else:
+                    total_after += size_diff
 
             logger.info(
-                f"Memory cleanup: {total_before / 1024:.2f} KB freed, {total_after / 1024:.2f} KB newly allocated after request."
+                "Memory cleanup: %.2f KB freed, %.2f KB newly allocated after request.",
+                total_before / 1024,
+                total_after / 1024,
             )
 
-            # Add a metric for memory used during the request (in KB)
-            metrics.add_metric(
-                name=REQUEST_MEMORY_ALLOCATED_KB,
-                unit=MetricUnit.Kilobytes,
-                value=total_after / 1024,
-            )
-            metrics.add_metric(
-                name=REQUEST_MEMORY_FREED_KB,
-                unit=MetricUnit.Kilobytes,
-                value=total_before / 1024,
-            )
-            metrics.flush_metrics()
+            if _MEMORY_METRICS_ENABLED:
+                # Add a metric for memory used during the request (in KB)
+                metrics.add_dimension(name=ENDPOINT, value=scope["path"])
+                metrics.add_metric(
+                    name=REQUEST_MEMORY_ALLOCATED_KB,
+                    unit=MetricUnit.Kilobytes,
+                    value=total_after / 1024,
+                )
+                metrics.add_metric(
+                    name=REQUEST_MEMORY_FREED_KB,
+                    unit=MetricUnit.Kilobytes,
+                    value=total_before / 1024,
+                )
+                metrics.flush_metrics()
 
             tracemalloc.stop()
         else:
             logger.warning(
                 "tracemalloc is not tracing; skipping memory snapshot and metrics."
             )
-
-        return response
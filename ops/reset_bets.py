@@ -5,20 +5,27 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from common.helpers.bet_helper import BetHelper
+from common.helpers.membership_helper import MembershipHelper
 from common.helpers.room_helper import RoomHelper
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
 
+# Rooms are reset in parallel. The workers read and reset bets through the
+# thread-safe DynamoDB client, while the room scan stays on the main thread
+_RESET_WORKERS = 16
+
+_TABLE_NAMES = {
+    "prod": "FortunasBet-UserTable-Prod",
+    "testing": "FortunasBet-UserTable-Testing",
+}
+
 
 def reset_bets(args):
     """
     Handle the reset logic based on the parsed arguments.
     """
     # Determine the table name based on the stage
-    table_name = (
-        "FortunasBet-UserTable-Testing"
-        if args.stage != "prod"
-        else "FortunasBet-UserTable-Prod"
-    )
+    table_name = _TABLE_NAMES.get(args.stage, _TABLE_NAMES["testing"])
     bet_helper = BetHelper(request_id="ops-tool", table_name=table_name)
 
     if args.command == "reset-room":
@@ -37,15 +44,41 @@ def reset_bets(args):
         )
     elif args.command == "reset-all-bets":
         room_helper = RoomHelper(request_id="ops-tool", table_name=table_name)
-        rooms = room_helper.get_all_rooms()  # Fetch all room IDs
         total_bets_reset = 0
-
-        for room in rooms:
-            count = bet_helper.reset_bets_for_room(room_id=room["room_id"])
-            total_bets_reset += count
-            print(f"Successfully reset {count} bets in room {room['room_id']}.")
+        with ThreadPoolExecutor(max_workers=_RESET_WORKERS) as executor:
+            # Rooms are submitted as each scan page arrives
+            futures = {
+                executor.submit(bet_helper.reset_bets_for_room, room["room_id"]): room[
+                    "room_id"
+                ]
+                for room in room_helper.iter_all_rooms()
+            }
+            for future in as_completed(futures):
+                count = future.result()
+                total_bets_reset += count
+                print(f"Successfully reset {count} bets in room {futures[future]}.")
 
         print(f"Successfully reset a total of {total_bets_reset} bets in all rooms.")
+    elif args.command == "backfill-bet-index":
+        room_helper = RoomHelper(request_id="ops-tool", table_name=table_name)
+        total_bets_updated = 0
+
+        for room in room_helper.iter_all_rooms():
+            count = bet_helper.assign_user_index_keys(room_id=room["room_id"])
+            total_bets_updated += count
+            print(
+                f"Assigned user index keys to {count} bets in room {room['room_id']}."
+            )
+
+        print(
+            f"Assigned user index keys to a total of {total_bets_updated} bets in all rooms."
+        )
+    elif args.command == "backfill-membership-index":
+        membership_helper = MembershipHelper(
+            request_id="ops-tool", table_name=table_name
+        )
+        count = membership_helper.assign_membership_index_keys()
+        print(f"Assigned user membership index keys to {count} memberships.")
 
 
 def main():
@@ -105,6 +138,30 @@ def main():
         help="The stage to operate on (default: testing).",
     )
 
+    # Subparser for backfilling the GSI_User keys on existing bets
+    backfill_bet_index_parser = subparsers.add_parser(
+        "backfill-bet-index",
+        help="Add GSI_User keys to bets created before the index existed.",
+    )
+    backfill_bet_index_parser.add_argument(
+        "--stage",
+        choices=["testing", "prod"],
+        default="testing",
+        help="The stage to operate on (default: testing).",
+    )
+
+    # Subparser for backfilling the UserMembershipIndex keys on existing memberships
+    backfill_membership_index_parser = subparsers.add_parser(
+        "backfill-membership-index",
+        help="Add UserMembershipIndex keys to memberships created before the index existed.",
+    )
+    backfill_membership_index_parser.add_argument(
+        "--stage",
+        choices=["testing", "prod"],
+        default="testing",
+        help="The stage to operate on (default: testing).",
+    )
+
     args = parser.parse_args()
     reset_bets(args)
 